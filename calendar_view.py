@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
 """GitHub-style contribution calendar for the Daily Planner & Logger."""
+import os
 import sys
 import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from lib.storage import Storage
-from rich.console import Console
+from lib.storage import Storage, json_dumps, json_loads
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
@@ -19,6 +23,58 @@ from rich.table import Table
 # Goals storage path
 home = Path.home()
 GOALS_FILE = home / ".daily_planner" / "data" / "goals.json"
+REVIEWS_FILE = GOALS_FILE.parent / "reviews.jsonl"
+LAST_REVIEWS_FILE = GOALS_FILE.parent / "last_reviews.json"
+
+
+# Process umask, read once (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_json_atomic(path: Path, data, indent: Optional[int] = None):
+    """Write JSON in one buffered write to a temp file, then rename it into place.
+    
+    A crash mid-write never leaves a half-written file behind.
+    
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+        indent: Indentation (orjson only supports 2)
+    """
+    payload = json_dumps(data, indent)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    tmp = tempfile.NamedTemporaryFile('wb', dir=path.parent, delete=False, buffering=1 << 20)
+    try:
+        with tmp:
+            tmp.write(payload)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # Temp files are created 0600; keep the mode a plain open() would give
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+# Parsed goals cached against the file's stat, so repeat loads skip the JSON parse
+_GOALS_CACHE = {"mtime": None, "size": None, "data": None}
+
+
+def _cache_goals(goals_data: Dict):
+    """Remember goals data for the current on-disk version of GOALS_FILE.
+    
+    Args:
+        goals_data: Goals dictionary matching the file contents
+    """
+    stat = GOALS_FILE.stat()
+    _GOALS_CACHE["mtime"] = stat.st_mtime_ns
+    _GOALS_CACHE["size"] = stat.st_size
+    _GOALS_CACHE["data"] = goals_data
 
 
 def load_goals() -> Dict:
@@ -27,11 +83,20 @@ def load_goals() -> Dict:
     Returns:
         Dictionary with goals data
     """
-    if GOALS_FILE.exists():
-        with open(GOALS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return migrate_goals_data(data)
-    return {"goals": [], "archived": []}
+    try:
+        stat = GOALS_FILE.stat()
+    except FileNotFoundError:
+        return {"goals": [], "archived": []}
+    
+    if (_GOALS_CACHE["data"] is not None
+            and _GOALS_CACHE["mtime"] == stat.st_mtime_ns
+            and _GOALS_CACHE["size"] == stat.st_size):
+        # Shared, not copied: every path that mutates goals ends in save_goals
+        return _GOALS_CACHE["data"]
+    
+    data = migrate_goals_data(json_loads(GOALS_FILE.read_bytes()))
+    _cache_goals(data)
+    return data
 
 
 def save_goals(goals_data: Dict):
@@ -41,8 +106,119 @@ def save_goals(goals_data: Dict):
         goals_data: Goals dictionary to save
     """
     GOALS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(GOALS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(goals_data, f, indent=2, ensure_ascii=False)
+    _write_json_atomic(GOALS_FILE, goals_data, indent=2)
+    _cache_goals(goals_data)
+
+
+def _append_jsonl(path: Path, records: List[Dict]):
+    """Append records to a JSON Lines file in a single write.
+    
+    Args:
+        path: JSON Lines file
+        records: Records to append, one per line
+    """
+    payload = b"".join(json_dumps(record) + b"\n" for record in records)
+    with open(path, 'ab', buffering=1 << 16) as f:
+        f.write(payload)
+
+
+def _tail_lines(path: Path, count: int, block_size: int = 1 << 16) -> List[bytes]:
+    """Read the last non-empty lines of a file without reading all of it.
+    
+    Args:
+        path: File to read
+        count: Number of lines wanted
+        block_size: Bytes read per step, working backwards from the end
+    
+    Returns:
+        Up to `count` lines, oldest first
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = [line for line in data.splitlines() if line.strip()]
+    return lines[-count:]
+
+
+def _reviews_signature() -> Optional[List[int]]:
+    """Get the (mtime, size) of the reviews log, or None if it doesn't exist."""
+    try:
+        stat = REVIEWS_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _ensure_reviews_migrated():
+    """Move reviews still embedded in goals.json into the reviews log.
+    
+    Only goals files written before the log existed have a "reviews" key,
+    so the migration is skipped without parsing when the key is absent.
+    """
+    try:
+        raw = GOALS_FILE.read_bytes()
+    except FileNotFoundError:
+        return
+    if b'"reviews"' in raw:
+        migrate_goals_data(json_loads(raw))
+
+
+def load_reviews() -> List[Dict]:
+    """Load all goal reviews, oldest first.
+    
+    Returns:
+        List of review dictionaries
+    """
+    _ensure_reviews_migrated()
+    try:
+        raw = REVIEWS_FILE.read_bytes()
+    except FileNotFoundError:
+        return []
+    return [json_loads(line) for line in raw.splitlines() if line.strip()]
+
+
+def load_recent_reviews(limit: int = 10) -> List[Dict]:
+    """Load the most recent goal reviews, newest first.
+    
+    Args:
+        limit: Maximum number of reviews to return
+    
+    Returns:
+        List of review dictionaries
+    """
+    _ensure_reviews_migrated()
+    try:
+        lines = _tail_lines(REVIEWS_FILE, limit)
+    except FileNotFoundError:
+        return []
+    return [json_loads(line) for line in reversed(lines)]
+
+
+def append_review(review: Dict):
+    """Append a review to the reviews log.
+    
+    Args:
+        review: Review dictionary
+    """
+    before = _reviews_signature()
+    REVIEWS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _append_jsonl(REVIEWS_FILE, [review])
+    
+    # Fold the new review into the last-review sidecar if it was current
+    try:
+        sidecar = json_loads(LAST_REVIEWS_FILE.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return
+    if before is not None and sidecar.get("reviews") == before:
+        last = sidecar["last"]
+        last[review["type"]] = review["date_epoch"]
+        _write_json_atomic(LAST_REVIEWS_FILE, {"reviews": _reviews_signature(), "last": last})
 
 
 def calculate_time_progress(created_at: str, deadline: str) -> int:
@@ -223,12 +399,42 @@ def migrate_goals_data(goals_data: Dict) -> Dict:
         except Exception as e:
             print(f"❌ Failed to migrate to-dos: {e}")
     
+    # 3. Reviews Migration (move embedded reviews into the append-only log)
+    reviews = goals_data.pop("reviews", None)
+    if reviews is not None:
+        # A crash before the save below leaves these reviews in goals.json as
+        # well, so skip any an earlier run already appended to the log
+        try:
+            logged = [json_loads(line) for line in REVIEWS_FILE.read_bytes().splitlines() if line.strip()]
+        except FileNotFoundError:
+            logged = []
+        pending = [r for r in sorted(reviews, key=lambda r: r.get("date", "")) if r not in logged]
+        if pending:
+            _append_jsonl(REVIEWS_FILE, pending)
+        migrated = True
+    
     if migrated:
         save_goals(goals_data)
     
     return goals_data
 
 
+def _compute_stage_info(progress: int) -> Tuple[str, str, str]:
+    """Compute stage name, emoji, and color for a progress value."""
+    if progress <= 10:
+        return "Positive", "🌱", "green"  # Starting with good intentions
+    elif progress <= 30:
+        return "Negative", "🔥", "red"    # Struggle phase
+    elif progress <= 50:
+        return "Current", "⚡", "yellow"  # Working through it
+    else:
+        return "Improve", "🚀", "cyan"    # Getting better
+
+
+# Stage info for every valid progress value, indexed by progress
+_STAGE_TABLE = tuple(_compute_stage_info(p) for p in range(101))
+
+
 def get_stage_info(progress: int) -> Tuple[str, str, str]:
     """Get stage name, emoji, and color based on progress.
     
@@ -238,14 +444,9 @@ def get_stage_info(progress: int) -> Tuple[str, str, str]:
     Returns:
         Tuple of (stage_name, emoji, color)
     """
-    if progress <= 10:
-        return "Positive", "🌱", "green"  # Starting with good intentions
-    elif progress <= 30:
-        return "Negative", "🔥", "red"    # Struggle phase
-    elif progress <= 50:
-        return "Current", "⚡", "yellow"  # Working through it
-    else:
-        return "Improve", "🚀", "cyan"    # Getting better
+    if type(progress) is int and 0 <= progress <= 100:
+        return _STAGE_TABLE[progress]
+    return _compute_stage_info(progress)
 
 
 def add_goal(console: Console) -> bool:
@@ -260,12 +461,15 @@ def add_goal(console: Console) -> bool:
     import questionary
     from questionary import Choice
     
-    console.print("\n[bold cyan]🎯 Add New Goal[/bold cyan]\n")
-    console.print("[dim]Each goal has 4 stages based on progress:[/dim]")
-    console.print("  [green]🌱 Positive (0-10%)[/green] - Starting with good intentions")
-    console.print("  [red]🔥 Negative (10-30%)[/red] - Struggle phase")
-    console.print("  [yellow]⚡ Current (30-50%)[/yellow] - Working through it")
-    console.print("  [cyan]🚀 Improve (50-100%)[/cyan] - Getting better\n")
+    intro = [
+        "\n[bold cyan]🎯 Add New Goal[/bold cyan]\n",
+        "[dim]Each goal has 4 stages based on progress:[/dim]",
+        "  [green]🌱 Positive (0-10%)[/green] - Starting with good intentions",
+        "  [red]🔥 Negative (10-30%)[/red] - Struggle phase",
+        "  [yellow]⚡ Current (30-50%)[/yellow] - Working through it",
+        "  [cyan]🚀 Improve (50-100%)[/cyan] - Getting better\n",
+    ]
+    console.print(Group(*(Text.from_markup(line) for line in intro)))
     
     # Goal name
     name = questionary.text(
@@ -514,6 +718,7 @@ def update_goal_progress(console: Console) -> bool:
     from questionary import Choice
     
     goals_data = load_goals()
+    by_id = {g["id"]: g for g in goals_data["goals"]}
     active_goals = [g for g in goals_data["goals"] if g.get("status") == "active"]
     
     if not active_goals:
@@ -541,11 +746,7 @@ def update_goal_progress(console: Console) -> bool:
         return False
     
     # Find the goal and show stages
-    selected_goal = None
-    for goal in goals_data["goals"]:
-        if goal["id"] == goal_id:
-            selected_goal = goal
-            break
+    selected_goal = by_id.get(goal_id)
     
     if selected_goal and "stages" in selected_goal:
         console.print(f"\n[bold]{selected_goal['name']}[/bold]")
@@ -569,19 +770,17 @@ def update_goal_progress(console: Console) -> bool:
     old_progress = selected_goal['progress'] if selected_goal else 0
     
     # Update goal
-    for goal in goals_data["goals"]:
-        if goal["id"] == goal_id:
-            goal["progress"] = progress
-            goal["last_updated"] = datetime.now().isoformat()
-            
-            if progress >= 100:
-                complete = questionary.confirm(
-                    "Goal is 100% complete! Mark as completed?"
-                ).ask()
-                if complete:
-                    goal["status"] = "completed"
-                    goal["completed_at"] = datetime.now().isoformat()
-            break
+    if selected_goal:
+        selected_goal["progress"] = progress
+        selected_goal["last_updated"] = datetime.now().isoformat()
+        
+        if progress >= 100:
+            complete = questionary.confirm(
+                "Goal is 100% complete! Mark as completed?"
+            ).ask()
+            if complete:
+                selected_goal["status"] = "completed"
+                selected_goal["completed_at"] = datetime.now().isoformat()
     
     save_goals(goals_data)
     
@@ -598,23 +797,41 @@ def update_goal_progress(console: Console) -> bool:
     return True
 
 
+_PRIORITY_EMOJI = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢"
+}
+
+_TYPE_EMOJI = {
+    "long_term": "🎯",
+    "yearly": "📅",
+    "monthly": "📆",
+    "weekly": "📋"
+}
+
+
+# Sort rank per priority; unknown priorities sort last
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+
+def get_priority_rank(goal: Dict) -> int:
+    """Get sort rank for a goal's priority (high first)."""
+    return _PRIORITY_RANK.get(goal.get("priority", "low"), 3)
+
+
 def get_priority_emoji(priority: str) -> str:
     """Get emoji for priority level."""
-    return {
-        "high": "🔴",
-        "medium": "🟡",
-        "low": "🟢"
-    }.get(priority, "⚪")
+    return _PRIORITY_EMOJI.get(priority, "⚪")
 
 
 def get_type_emoji(goal_type: str) -> str:
     """Get emoji for goal type."""
-    return {
-        "long_term": "🎯",
-        "yearly": "📅",
-        "monthly": "📆",
-        "weekly": "📋"
-    }.get(goal_type, "📌")
+    return _TYPE_EMOJI.get(goal_type, "📌")
+
+
+# Last goals panel built by display_goals, keyed by the fields it renders
+_display_cache = {"key": None, "panel": None}
 
 
 def display_goals(console: Console):
@@ -635,6 +852,15 @@ def display_goals(console: Console):
         ))
         return
     
+    # Reuse the previous panel if nothing it shows has changed
+    key = tuple(
+        (g["id"], g.get("progress", 0), g.get("priority"), g["name"], g.get("status"))
+        for g in active_goals
+    ) + (("done", len(completed_goals)),)
+    if key == _display_cache["key"]:
+        console.print(Group(Text("\n"), _display_cache["panel"]))
+        return
+    
     # Create goals table
     table = Table(show_header=True, border_style="cyan", expand=True)
     table.add_column("", width=2)  # Priority
@@ -643,8 +869,7 @@ def display_goals(console: Console):
     table.add_column("Progress", justify="left", width=18)
     
     # Sort by priority
-    priority_order = {"high": 0, "medium": 1, "low": 2}
-    active_goals.sort(key=lambda x: priority_order.get(x.get("priority", "low"), 3))
+    active_goals.sort(key=get_priority_rank)
     
     for goal in active_goals:
         progress = goal.get("progress", 0)
@@ -675,13 +900,26 @@ def display_goals(console: Console):
             ""
         )
     
-    console.print("\n")
-    console.print(Panel(
+    panel = Panel(
         table,
         title="[bold cyan]🎯 Goals[/bold cyan]",
         border_style="cyan",
         padding=(0, 1)
-    ))
+    )
+    _display_cache["key"] = key
+    _display_cache["panel"] = panel
+    
+    console.print(Group(Text("\n"), panel))
+
+
+def _wait(console: Console):
+    """Pause until the user presses Enter.
+    
+    Args:
+        console: Rich console
+    """
+    console.print("\n[dim]Press Enter to continue...[/dim]")
+    input()
 
 
 def manage_goals(console: Console):
@@ -693,6 +931,15 @@ def manage_goals(console: Console):
     import questionary
     from questionary import Choice
     
+    actions = {
+        "add": add_goal,
+        "progress": update_goal_progress,
+        "review": do_goal_review,
+        "view": view_all_goals,
+        "past_reviews": view_past_reviews,
+        "archive": archive_goal,
+    }
+    
     while True:
         console.clear()
         display_goals(console)
@@ -718,32 +965,43 @@ def manage_goals(console: Console):
             use_arrow_keys=True
         ).ask()
         
-        if result == "add":
-            add_goal(console)
-            console.print("\n[dim]Press Enter to continue...[/dim]")
-            input()
-        elif result == "progress":
-            update_goal_progress(console)
-            console.print("\n[dim]Press Enter to continue...[/dim]")
-            input()
-        elif result == "review":
-            do_goal_review(console)
-            console.print("\n[dim]Press Enter to continue...[/dim]")
-            input()
-        elif result == "view":
-            view_all_goals(console)
-            console.print("\n[dim]Press Enter to continue...[/dim]")
-            input()
-        elif result == "past_reviews":
-            view_past_reviews(console)
-            console.print("\n[dim]Press Enter to continue...[/dim]")
-            input()
-        elif result == "archive":
-            archive_goal(console)
-            console.print("\n[dim]Press Enter to continue...[/dim]")
-            input()
-        elif result == "back" or result is None:
+        if result == "back" or result is None:
             break
+        
+        action = actions.get(result)
+        if action:
+            action(console)
+            _wait(console)
+
+
+def _latest_review_epochs(reviews: List) -> Dict[str, int]:
+    """Find the most recent review time of each type.
+    
+    Reviews are appended as they happen, so scan from the end and stop once
+    every type has been seen.
+    
+    Args:
+        reviews: List of review dictionaries
+    
+    Returns:
+        Dict of review type -> epoch seconds of the latest review
+    """
+    last = {}
+    needed = {"weekly", "monthly", "yearly"}
+    
+    for review in reversed(reviews):
+        review_type = review["type"]
+        if review_type in needed:
+            review_epoch = review.get("date_epoch")
+            if review_epoch is None:
+                # Legacy reviews only carry the ISO date
+                review_epoch = int(datetime.fromisoformat(review["date"]).timestamp())
+            last[review_type] = review_epoch
+            needed.discard(review_type)
+            if not needed:
+                break
+    
+    return last
 
 
 def check_review_due() -> Optional[str]:
@@ -752,42 +1010,31 @@ def check_review_due() -> Optional[str]:
     Returns:
         Reminder message if review is due, None otherwise
     """
-    goals_data = load_goals()
-    reviews = goals_data.get("reviews", [])
-    now = datetime.now()
+    now_epoch = int(datetime.now().timestamp())
     
-    # Get last review dates by type
-    last_weekly = None
-    last_monthly = None
-    last_yearly = None
+    # Read the last-review sidecar instead of parsing every review, as long
+    # as it was written for the current reviews log
+    signature = _reviews_signature()
+    try:
+        sidecar = json_loads(LAST_REVIEWS_FILE.read_bytes())
+    except (FileNotFoundError, ValueError):
+        sidecar = {}
     
-    for review in reviews:
-        review_date = datetime.fromisoformat(review["date"])
-        review_type = review["type"]
-        
-        if review_type == "weekly":
-            if not last_weekly or review_date > last_weekly:
-                last_weekly = review_date
-        elif review_type == "monthly":
-            if not last_monthly or review_date > last_monthly:
-                last_monthly = review_date
-        elif review_type == "yearly":
-            if not last_yearly or review_date > last_yearly:
-                last_yearly = review_date
+    if signature is not None and sidecar.get("reviews") == signature:
+        last = sidecar["last"]
+    else:
+        last = _latest_review_epochs(load_reviews())
+        signature = _reviews_signature()
+        if signature is not None:
+            _write_json_atomic(LAST_REVIEWS_FILE, {"reviews": signature, "last": last})
     
     reminders = []
     
-    # Check weekly (7 days)
-    if not last_weekly or (now - last_weekly).days >= 7:
-        reminders.append("Weekly review due!")
-    
-    # Check monthly (30 days)
-    if not last_monthly or (now - last_monthly).days >= 30:
-        reminders.append("Monthly review due!")
-    
-    # Check yearly (365 days)
-    if not last_yearly or (now - last_yearly).days >= 365:
-        reminders.append("Yearly review due!")
+    # Weekly (7 days), monthly (30 days), yearly (365 days)
+    for review_type, days in (("weekly", 7), ("monthly", 30), ("yearly", 365)):
+        last_epoch = last.get(review_type)
+        if last_epoch is None or now_epoch - last_epoch >= days * 86400:
+            reminders.append(f"{review_type.capitalize()} review due!")
     
     return " | ".join(reminders) if reminders else None
 
@@ -805,6 +1052,7 @@ def do_goal_review(console: Console) -> bool:
     from questionary import Choice
     
     goals_data = load_goals()
+    by_id = {g["id"]: g for g in goals_data["goals"]}
     active_goals = [g for g in goals_data["goals"] if g.get("status") == "active"]
     
     if not active_goals:
@@ -903,12 +1151,6 @@ def do_goal_review(console: Console) -> bool:
             ).ask()
             if progress_str:
                 new_progress = int(progress_str)
-                # Update goal progress
-                for g in goals_data["goals"]:
-                    if g["id"] == goal["id"]:
-                        g["progress"] = new_progress
-                        g["last_updated"] = datetime.now().isoformat()
-                        break
         
         review_entries.append({
             "goal_id": goal["id"],
@@ -930,18 +1172,25 @@ def do_goal_review(console: Console) -> bool:
     ).ask()
     
     # Save review
-    if "reviews" not in goals_data:
-        goals_data["reviews"] = []
-    
+    now = datetime.now()
     review = {
-        "date": datetime.now().isoformat(),
+        "date": now.isoformat(),
+        "date_epoch": int(now.timestamp()),
         "type": review_type,
         "entries": review_entries,
         "overall": overall.strip() if overall else ""
     }
     
-    goals_data["reviews"].append(review)
-    save_goals(goals_data)
+    # Progress changes are applied only now, so a review abandoned halfway
+    # leaves the cached goals untouched
+    changed = [e for e in review_entries if e["progress_before"] != e["progress_after"]]
+    if changed:
+        for entry in changed:
+            target = by_id[entry["goal_id"]]
+            target["progress"] = entry["progress_after"]
+            target["last_updated"] = now.isoformat()
+        save_goals(goals_data)
+    append_review(review)
     
     # Summary
     console.print("\n[bold green]✅ Review saved![/bold green]\n")
@@ -967,10 +1216,10 @@ def view_past_reviews(console: Console):
     import questionary
     from questionary import Choice
     
-    goals_data = load_goals()
-    reviews = goals_data.get("reviews", [])
+    # Show recent reviews (last 10)
+    recent = load_recent_reviews(10)
     
-    if not reviews:
+    if not recent:
         console.print("\n[yellow]No reviews yet. Complete a review first![/yellow]")
         return
     
@@ -979,9 +1228,6 @@ def view_past_reviews(console: Console):
     # Group by type
     type_emoji = {"weekly": "📅", "monthly": "📆", "yearly": "🗓️"}
     
-    # Show recent reviews (last 10)
-    recent = sorted(reviews, key=lambda x: x["date"], reverse=True)[:10]
-    
     choices = []
     for i, review in enumerate(recent):
         review_date = datetime.fromisoformat(review["date"])
@@ -1114,20 +1360,148 @@ def archive_goal(console: Console) -> bool:
         return False
     
     # Find and archive
-    for i, goal in enumerate(goals_data["goals"]):
-        if goal["id"] == goal_id:
-            goal["archived_at"] = datetime.now().isoformat()
-            if "archived" not in goals_data:
-                goals_data["archived"] = []
-            goals_data["archived"].append(goal)
-            goals_data["goals"].pop(i)
-            break
+    by_id = {g["id"]: g for g in goals_data["goals"]}
+    goal = by_id.get(goal_id)
+    if goal:
+        goal["archived_at"] = datetime.now().isoformat()
+        if "archived" not in goals_data:
+            goals_data["archived"] = []
+        goals_data["archived"].append(goal)
+        goals_data["goals"].remove(goal)
     
     save_goals(goals_data)
     console.print("\n[bold green]✅ Goal archived![/bold green]")
     return True
 
 
+def _count_tasks(jobs: List, completion: Dict) -> Tuple[int, int, int]:
+    """Count done, quit and pending tasks, including sub-jobs.
+    
+    Walks the job tree with an explicit stack instead of recursion.
+    
+    Args:
+        jobs: List of job dictionaries
+        completion: Dict of job_name -> status ('done', 'quit', or None)
+    
+    Returns:
+        Tuple of (completed, quit_count, pending)
+    """
+    completed = quit_count = pending = 0
+    completion_get = completion.get
+    stack = list(jobs)
+    while stack:
+        job = stack.pop()
+        job_get = job.get
+        status = completion_get(job_get('name') or job_get('task_name', 'Unknown'))
+        
+        if status == 'done' or status is True:
+            completed += 1
+        elif status == 'quit':
+            quit_count += 1
+        else:
+            pending += 1
+        
+        sub_jobs = job_get('sub_jobs')
+        if sub_jobs:
+            stack.extend(sub_jobs)
+    
+    return completed, quit_count, pending
+
+
+# Shared summary for days without a plan (most days); treat as read-only
+_NO_PLAN_DAY = {
+    'completed': 0,
+    'quit': 0,
+    'pending': 0,
+    'total': 0,
+    'has_plan': False
+}
+
+
+@lru_cache(maxsize=512)
+def _plan_stats(path: str, mtime: int) -> Optional[Tuple[int, int, int]]:
+    """Count a plan file's tasks, memoized on the file's path and mtime.
+    
+    A changed file gets a new mtime and therefore a fresh cache entry.
+    
+    Args:
+        path: Path to the plan JSON file
+        mtime: File modification time in nanoseconds
+    
+    Returns:
+        Tuple of (completed, quit_count, pending), or None if there is no plan
+    """
+    try:
+        plan = json_loads(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+    if not plan:
+        return None
+    return _count_tasks(plan.get('jobs', []), plan.get('completion_status', {}))
+
+
+def _stats_to_counts(stats: Optional[Tuple[int, int, int]]) -> Dict:
+    """Convert _plan_stats output into a day's contribution counts.
+    
+    Args:
+        stats: Tuple of (completed, quit_count, pending), or None if there is no plan
+    
+    Returns:
+        Dictionary with completed/quit/pending/total counts and has_plan
+    """
+    if not stats:
+        return _NO_PLAN_DAY
+    
+    completed, quit_count, pending = stats
+    return {
+        'completed': completed,
+        'quit': quit_count,
+        'pending': pending,
+        'total': completed + quit_count + pending,
+        'has_plan': True
+    }
+
+
+# Weeks of summaries kept in the sidecar, matching the widest calendar view
+_SUMMARY_WEEKS = 52
+
+# Per-day summaries shared by every view, keyed by sidecar path
+_summaries_cache: Dict[str, Dict] = {}
+
+
+def _summaries_path(storage: Storage) -> Path:
+    """Get the path of the contribution summary sidecar."""
+    return storage.data_dir / "contrib_cache.json"
+
+
+def _load_summaries(storage: Storage) -> Dict:
+    """Load per-day summaries, each tagged with the plan file's mtime.
+    
+    The sidecar is read once per process; the returned dict is shared, so
+    updates made by one view are seen by the others.
+    
+    Args:
+        storage: Storage instance
+    
+    Returns:
+        Dictionary mapping date strings to {'mtime': ..., 'counts': {...}}
+    """
+    cache_path = _summaries_path(storage)
+    key = str(cache_path)
+    summaries = _summaries_cache.get(key)
+    if summaries is None:
+        try:
+            summaries = json_loads(cache_path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            summaries = {}
+        _summaries_cache[key] = summaries
+    return summaries
+
+
+# (data dir, weeks, first day ordinal) -> (plan mtimes, contributions) of the last call
+_contribution_cache = {}
+
+
 def get_contribution_data(storage: Storage, weeks: int = 52) -> Dict[str, Dict]:
     """Get contribution data for the specified number of weeks.
     
@@ -1142,62 +1516,70 @@ def get_contribution_data(storage: Storage, weeks: int = 52) -> Dict[str, Dict]:
     end_date = datetime.now()
     start_date = end_date - timedelta(weeks=weeks)
     
-    current = start_date
-    while current <= end_date:
-        date_str = current.strftime("%Y-%m-%d")
-        plan = storage.load_plan(current)
+    start_ord = start_date.toordinal()
+    
+    # One directory scan tells us which days have a plan and when it changed
+    plan_mtimes = storage.get_plan_mtimes(start_date, end_date)
+    
+    # Unchanged plan files on the same day give the same result as last time
+    cache_key = (str(storage.data_dir), weeks, start_ord)
+    cached_result = _contribution_cache.get(cache_key)
+    if cached_result is not None and cached_result[0] == plan_mtimes:
+        return cached_result[1]
+    
+    num_days = (end_date - start_date).days + 1
+    dates = [start_date + timedelta(days=i) for i in range(num_days)]
+    date_strs = [date.fromordinal(start_ord + i).isoformat() for i in range(num_days)]
+    
+    summaries = _load_summaries(storage)
+    stale = []
+    dirty = False
+    
+    for current, date_str in zip(dates, date_strs):
+        mtime = plan_mtimes.get(date_str)
         
-        if plan:
-            completion = plan.get('completion_status', {})
-            jobs = plan.get('jobs', [])
-            
-            # Count tasks recursively
-            def count_tasks(job_list):
-                completed = quit_count = pending = 0
-                for job in job_list:
-                    job_name = job.get('name') or job.get('task_name', 'Unknown')
-                    status = completion.get(job_name)
-                    
-                    if status == 'done' or status is True:
-                        completed += 1
-                    elif status == 'quit':
-                        quit_count += 1
-                    else:
-                        pending += 1
-                    
-                    sub_jobs = job.get('sub_jobs', [])
-                    if sub_jobs:
-                        sub_stats = count_tasks(sub_jobs)
-                        completed += sub_stats[0]
-                        quit_count += sub_stats[1]
-                        pending += sub_stats[2]
-                
-                return completed, quit_count, pending
-            
-            completed, quit_count, pending = count_tasks(jobs)
-            total = completed + quit_count + pending
-            
-            contributions[date_str] = {
-                'completed': completed,
-                'quit': quit_count,
-                'pending': pending,
-                'total': total,
-                'has_plan': True
-            }
+        cached = summaries.get(date_str)
+        if mtime is None:
+            # Days without a plan need no summary; drop one left by a deleted plan
+            contributions[date_str] = _NO_PLAN_DAY
+            if cached is not None:
+                del summaries[date_str]
+                dirty = True
+        elif cached is not None and cached.get('mtime') == mtime:
+            contributions[date_str] = cached['counts']
         else:
-            contributions[date_str] = {
-                'completed': 0,
-                'quit': 0,
-                'pending': 0,
-                'total': 0,
-                'has_plan': False
-            }
-        
-        current += timedelta(days=1)
+            contributions[date_str] = None  # Keeps the dict in date order
+            stale.append((current, date_str, mtime))
     
+    def stale_stats(item):
+        current, _, mtime = item
+        return _plan_stats(str(storage.get_plan_path(current)), mtime)
+    
+    # Plan loads are I/O bound, so read the stale days concurrently
+    if len(stale) > 1:
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            all_stats = list(ex.map(stale_stats, stale))
+    else:
+        all_stats = [stale_stats(item) for item in stale]
+    
+    for (current, date_str, mtime), stats in zip(stale, all_stats):
+        contributions[date_str] = _stats_to_counts(stats)
+        summaries[date_str] = {'mtime': mtime, 'counts': contributions[date_str]}
+    
+    if stale or dirty:
+        # Forget days that have scrolled out of the widest calendar view
+        oldest = date.fromordinal(min(start_ord, end_date.toordinal() - 7 * _SUMMARY_WEEKS)).isoformat()
+        for date_str in [d for d in summaries if d < oldest]:
+            del summaries[date_str]
+        _write_json_atomic(_summaries_path(storage), summaries)
+    
+    if len(_contribution_cache) >= 8:
+        _contribution_cache.clear()  # Drops results from previous days
+    _contribution_cache[cache_key] = (plan_mtimes, contributions)
     return contributions
 
 
+@lru_cache(maxsize=256)
 def get_intensity_level(completed: int, total: int) -> int:
     """Get intensity level (0-4) based on completion.
     
@@ -1225,6 +1607,28 @@ def get_intensity_level(completed: int, total: int) -> int:
         return 4
 
 
+# GitHub-like green color gradient, indexed by intensity
+_BLOCK_STYLES = (
+    ("□", "dim"),           # 0: No activity
+    ("▪", "green4"),        # 1: Low (dark green)
+    ("▪", "green3"),        # 2: Medium-low
+    ("▪", "green1"),        # 3: Medium-high
+    ("▪", "bold bright_green"),  # 4: High (bright green)
+)
+
+
+# Weekday names indexed by date.weekday(), month names by month number
+WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_ABBR = (None, "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+              "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+# Special cells: today is highlighted, days outside the data are blank
+_TODAY_BLOCK = ("◉", "bold cyan")
+_EMPTY_BLOCK = (" ", None)
+
+
+@lru_cache(maxsize=None)
 def get_block_style(intensity: int, has_plan: bool) -> Tuple[str, str]:
     """Get the block character and style based on intensity.
     
@@ -1238,16 +1642,15 @@ def get_block_style(intensity: int, has_plan: bool) -> Tuple[str, str]:
     if not has_plan:
         return "□", "dim"
     
-    # GitHub-like green color gradient
-    styles = [
-        ("□", "dim"),           # 0: No activity
-        ("▪", "green4"),        # 1: Low (dark green)
-        ("▪", "green3"),        # 2: Medium-low
-        ("▪", "green1"),        # 3: Medium-high
-        ("▪", "bold bright_green"),  # 4: High (bright green)
-    ]
-    
-    return styles[intensity]
+    return _BLOCK_STYLES[intensity]
+
+
+# (intensity, has_plan) -> (character, style), so renderers do one lookup per cell
+BLOCK_STYLE_TABLE = {
+    (intensity, has_plan): get_block_style(intensity, has_plan)
+    for intensity in range(5)
+    for has_plan in (False, True)
+}
 
 
 def display_calendar(storage: Storage, console: Console, weeks: int = 52, show_goals: bool = True):
@@ -1275,8 +1678,13 @@ def display_calendar(storage: Storage, console: Console, weeks: int = 52, show_g
     day_labels = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
     
     # Calculate total completed tasks and active days
-    total_completed = sum(d['completed'] for d in contributions.values())
-    active_days = sum(1 for d in contributions.values() if d['completed'] > 0)
+    total_completed = 0
+    active_days = 0
+    for d in contributions.values():
+        completed = d['completed']
+        if completed > 0:
+            total_completed += completed
+            active_days += 1
     
     # Build calendar rows
     calendar_lines = []
@@ -1290,7 +1698,7 @@ def display_calendar(storage: Storage, console: Console, weeks: int = 52, show_g
     for week in range(weeks):
         week_start = start_date + timedelta(weeks=week)
         if week_start.month != prev_month:
-            month_name = week_start.strftime("%b")
+            month_name = MONTH_ABBR[week_start.month]
             month_positions.append((week, month_name))
             prev_month = week_start.month
     
@@ -1298,44 +1706,43 @@ def display_calendar(storage: Storage, console: Console, weeks: int = 52, show_g
     month_line = ["     "]  # Spacing
     last_pos = 0
     for pos, month_name in month_positions:
-        # Add spacing
-        spaces_needed = pos - last_pos
-        month_line.append(" " * (spaces_needed * 2))
-        month_line.append(month_name)
+        # Pad the name on the left to its week column
+        month_line.append(month_name.rjust(len(month_name) + (pos - last_pos) * 2))
         last_pos = pos + len(month_name) // 2
     
     calendar_lines.append(Text("".join(month_line), style="dim"))
     
+    start_ord = start_date.toordinal()
+    today_ord = datetime.now().date().toordinal()
+    
+    # Resolve each cell's final (char, style) up front, keyed by ordinal so
+    # cells can be addressed with integer offsets
+    blocks_by_ord = {}
+    for k, v in contributions.items():
+        cell_ord = date.fromisoformat(k).toordinal()
+        if cell_ord < today_ord:
+            blocks_by_ord[cell_ord] = BLOCK_STYLE_TABLE[
+                get_intensity_level(v['completed'], v['total']), v['has_plan']
+            ]
+        elif cell_ord == today_ord:
+            blocks_by_ord[cell_ord] = _TODAY_BLOCK
+        # Future dates are left empty
+    blocks_get = blocks_by_ord.get
+    
     # Build each day row (7 rows for each day of week)
     for day_idx in range(7):
         row = Text()
         
         # Day label (only show Mon, Wed, Fri for cleaner look)
-        if day_idx in [1, 3, 5]:
+        if day_idx in (1, 3, 5):
             row.append(f"{day_labels[day_idx]:>4} ", style="dim")
         else:
             row.append("     ")
         
         # Add each week's cell for this day
         for week in range(weeks):
-            cell_date = start_date + timedelta(weeks=week, days=day_idx)
-            date_str = cell_date.strftime("%Y-%m-%d")
-            
-            if date_str in contributions:
-                data = contributions[date_str]
-                intensity = get_intensity_level(data['completed'], data['total'])
-                char, style = get_block_style(intensity, data['has_plan'])
-                
-                # Special styling for today
-                if cell_date.date() == datetime.now().date():
-                    row.append("◉", style="bold cyan")
-                elif cell_date > datetime.now():
-                    row.append(" ")  # Future dates are empty
-                else:
-                    row.append(char, style=style)
-            else:
-                row.append(" ")
-            
+            char, style = blocks_get(start_ord + week * 7 + day_idx, _EMPTY_BLOCK)
+            row.append(char, style=style)
             row.append(" ")  # Spacing between weeks
         
         calendar_lines.append(row)
@@ -1375,8 +1782,8 @@ def display_calendar(storage: Storage, console: Console, weeks: int = 52, show_g
             streak_line.stylize("dim")
         calendar_lines.append(streak_line)
     
-    # Create the panel
-    content = Text("\n").join(calendar_lines)
+    # Create the panel; Group renders the lines in sequence without copying them
+    content = Group(*calendar_lines)
     
     console.print("\n")
     console.print(Panel(
@@ -1423,38 +1830,30 @@ def display_detailed_view(storage: Storage, console: Console, month: Optional[in
     table.add_column("⏳ Pending", justify="center")
     table.add_column("Progress", justify="left")
     
+    # One directory scan for the whole month instead of a load per day
+    plan_mtimes = storage.get_plan_mtimes(first_day, min(last_day, now))
+    summaries = _load_summaries(storage)
+    
     current = first_day
     while current <= last_day and current <= now:
-        plan = storage.load_plan(current)
+        date_str = current.date().isoformat()
+        mtime = plan_mtimes.get(date_str)
         
-        if plan:
-            completion = plan.get('completion_status', {})
-            jobs = plan.get('jobs', [])
-            
-            def count_tasks(job_list):
-                completed = quit_count = pending = 0
-                for job in job_list:
-                    job_name = job.get('name') or job.get('task_name', 'Unknown')
-                    status = completion.get(job_name)
-                    
-                    if status == 'done' or status is True:
-                        completed += 1
-                    elif status == 'quit':
-                        quit_count += 1
-                    else:
-                        pending += 1
-                    
-                    sub_jobs = job.get('sub_jobs', [])
-                    if sub_jobs:
-                        sub_stats = count_tasks(sub_jobs)
-                        completed += sub_stats[0]
-                        quit_count += sub_stats[1]
-                        pending += sub_stats[2]
-                
-                return completed, quit_count, pending
-            
-            completed, quit_count, pending = count_tasks(jobs)
-            total = completed + quit_count + pending
+        # Reuse the calendar's summary when the plan hasn't changed since
+        cached = summaries.get(date_str)
+        if cached is not None and cached.get('mtime') == mtime:
+            counts = cached['counts']
+        elif mtime is None:
+            counts = _NO_PLAN_DAY
+        else:
+            counts = _stats_to_counts(_plan_stats(str(storage.get_plan_path(current)), mtime))
+            summaries[date_str] = {'mtime': mtime, 'counts': counts}
+        
+        if counts['has_plan']:
+            completed = counts['completed']
+            quit_count = counts['quit']
+            pending = counts['pending']
+            total = counts['total']
             
             # Create progress bar
             bar_width = 15
@@ -1479,7 +1878,7 @@ def display_detailed_view(storage: Storage, console: Console, month: Optional[in
             
             table.add_row(
                 f"[{date_style}]{current.day}[/{date_style}]" if date_style else str(current.day),
-                current.strftime("%a"),
+                WEEKDAY_ABBR[current.weekday()],
                 f"[green]{completed}[/green]" if completed > 0 else "[dim]0[/dim]",
                 f"[yellow]{quit_count}[/yellow]" if quit_count > 0 else "[dim]0[/dim]",
                 f"[red]{pending}[/red]" if pending > 0 else "[dim]0[/dim]",
@@ -1489,7 +1888,7 @@ def display_detailed_view(storage: Storage, console: Console, month: Optional[in
             date_style = "bold cyan" if current.date() == now.date() else "dim"
             table.add_row(
                 f"[{date_style}]{current.day}[/{date_style}]",
-                current.strftime("%a"),
+                WEEKDAY_ABBR[current.weekday()],
                 "[dim]-[/dim]",
                 "[dim]-[/dim]",
                 "[dim]-[/dim]",
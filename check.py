@@ -1,67 +1,87 @@
 #!/usr/bin/env python3
 """Check script - mark tasks as done from any day's plan with interactive menu."""
+import os
 import sys
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from lib.config_loader import load_config
 from lib.storage import Storage
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.table import Table
-import questionary
-from questionary import Choice
 
 
-def get_plans_hierarchy(storage: Storage) -> dict:
-    """Get plans organized by year/month/week hierarchy.
+# Weekday names indexed by date.weekday(), month names by month number
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def format_day_label(date_obj: datetime) -> str:
+    """Format a date like strftime("%A, %b %d") without the locale lookup.
+    
+    Args:
+        date_obj: Date to format
     
     Returns:
-        Nested dict: {year: {month: {week: [(date_str, plan_path), ...]}}}
+        Label such as "Monday, Jan 05"
     """
-    data_dir = storage.data_dir
+    return f"{_DAY_NAMES[date_obj.weekday()]}, {_MONTH_ABBR[date_obj.month]} {date_obj.day:02d}"
+
+
+def fast_parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date string without going through strptime.
     
-    # Find all plan files (both old flat structure and new hierarchy)
-    plan_files = list(data_dir.glob("*-plan.json"))  # Old flat
-    plan_files.extend(data_dir.glob("**/*-plan.json"))  # New hierarchy
+    Args:
+        date_str: Date string in YYYY-MM-DD format
     
-    # Remove duplicates and organize
-    hierarchy = {}
-    seen = set()
+    Returns:
+        datetime at midnight of that date
     
-    for plan_file in sorted(plan_files, reverse=True):
-        # Skip non-date plans (year-plan, month-plan, week-plan)
-        stem = plan_file.stem
-        if stem in ['year-plan', 'month-plan', 'week-plan']:
-            continue
-            
-        date_str = stem.replace("-plan", "")
-        
-        # Skip if already seen
-        if date_str in seen:
-            continue
-        seen.add(date_str)
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        raise ValueError(f"Invalid date: {date_str!r}")
+    return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+
+
+def get_plans_hierarchy(storage: Storage) -> dict:
+    """Get plans organized by year/month/week hierarchy.
+    
+    Returns:
+        Nested dict: {year: {month: {week: [(date_str, plan_path), ...]}}},
+        where plan_path is a path string
+    """
+    # Find all plan files (both old flat structure and new hierarchy) in one
+    # walk; the top level comes first, so flat files win over duplicates
+    plan_files = {}
+    for dirpath, _, filenames in os.walk(storage.data_dir):
+        for name in filenames:
+            # Only YYYY-MM-DD-plan.json; this also skips non-date plans
+            # (year-plan, month-plan, week-plan) by length alone
+            if len(name) != 20 or not name.endswith("-plan.json"):
+                continue
+            plan_files.setdefault(name[:-10], os.path.join(dirpath, name))
+    
+    # Organize newest first
+    hierarchy = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    
+    for date_str in sorted(plan_files, reverse=True):
+        plan_file = plan_files[date_str]
         
         try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            iso_year, week, _ = date_obj.isocalendar()
-            
-            if year not in hierarchy:
-                hierarchy[year] = {}
-            if month not in hierarchy[year]:
-                hierarchy[year][month] = {}
-            if week not in hierarchy[year][month]:
-                hierarchy[year][month][week] = []
-            
-            hierarchy[year][month][week].append((date_str, plan_file))
-        except:
+            date_obj = fast_parse_date(date_str)
+        except ValueError:
             continue
+        
+        week = date_obj.isocalendar()[1]
+        hierarchy[date_obj.year][date_obj.month][week].append((date_str, plan_file))
     
     return hierarchy
 
@@ -82,125 +102,189 @@ def display_plan_selection_hierarchical(storage: Storage, console: Console) -> s
         console.print("[red]No plans found.[/red]")
         return None
     
-    # Step 1: Select Year
-    years = sorted(hierarchy.keys(), reverse=True)
+    # Imported here so runs that exit early don't pay for prompt_toolkit
+    import questionary
+    from questionary import Choice
     
-    if len(years) == 1:
-        selected_year = years[0]
-    else:
-        year_choices = [Choice(f"📅 {y}", value=y) for y in years]
-        year_choices.append(Choice("← Cancel", value=None))
+    # Back restarts from the top, reusing the hierarchy scanned above
+    while True:
+        # Step 1: Select Year
+        years = sorted(hierarchy.keys(), reverse=True)
         
-        selected_year = questionary.select(
-            "Select year:",
-            choices=year_choices
-        ).ask()
+        if len(years) == 1:
+            selected_year = years[0]
+        else:
+            year_choices = [Choice(f"📅 {y}", value=y) for y in years]
+            year_choices.append(Choice("← Cancel", value=None))
+            
+            selected_year = questionary.select(
+                "Select year:",
+                choices=year_choices
+            ).ask()
+            
+            if not selected_year:
+                return None
         
-        if not selected_year:
-            return None
-    
-    # Step 2: Select Month
-    months = sorted(hierarchy[selected_year].keys(), reverse=True)
-    month_names = {1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun",
-                   7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"}
-    
-    if len(months) == 1:
-        selected_month = months[0]
-    else:
-        month_choices = [Choice(f"📆 {month_names[m]} {selected_year}", value=m) for m in months]
-        month_choices.append(Choice("← Back", value=None))
+        # Step 2: Select Month
+        months = sorted(hierarchy[selected_year].keys(), reverse=True)
         
-        selected_month = questionary.select(
-            "Select month:",
-            choices=month_choices
-        ).ask()
+        if len(months) == 1:
+            selected_month = months[0]
+        else:
+            month_choices = [Choice(f"📆 {_MONTH_ABBR[m]} {selected_year}", value=m) for m in months]
+            month_choices.append(Choice("← Back", value=None))
+            
+            selected_month = questionary.select(
+                "Select month:",
+                choices=month_choices
+            ).ask()
+            
+            if not selected_month:
+                continue  # Go back
         
-        if not selected_month:
-            return display_plan_selection_hierarchical(storage, console)  # Go back
-    
-    # Step 3: Select Week
-    weeks = sorted(hierarchy[selected_year][selected_month].keys(), reverse=True)
-    
-    if len(weeks) == 1:
-        selected_week = weeks[0]
-    else:
-        week_choices = [Choice(f"📋 Week {w}", value=w) for w in weeks]
-        week_choices.append(Choice("← Back", value=None))
+        # Step 3: Select Week
+        weeks = sorted(hierarchy[selected_year][selected_month].keys(), reverse=True)
+        
+        if len(weeks) == 1:
+            selected_week = weeks[0]
+        else:
+            week_choices = [Choice(f"📋 Week {w}", value=w) for w in weeks]
+            week_choices.append(Choice("← Back", value=None))
+            
+            selected_week = questionary.select(
+                "Select week:",
+                choices=week_choices
+            ).ask()
+            
+            if not selected_week:
+                continue
+        
+        # Step 4: Select Day
+        days = hierarchy[selected_year][selected_month][selected_week]
         
-        selected_week = questionary.select(
-            "Select week:",
-            choices=week_choices
+        if len(days) == 1:
+            return days[0][0]  # Return the date string
+        
+        # Every date in the hierarchy already parsed cleanly
+        day_choices = [
+            Choice(f"📄 {format_day_label(fast_parse_date(date_str))}", value=date_str)
+            for date_str, _ in sorted(days, reverse=True)
+        ]
+        day_choices.append(Choice("← Back", value=None))
+        
+        selected_day = questionary.select(
+            "Select day:",
+            choices=day_choices
         ).ask()
         
-        if not selected_week:
-            return display_plan_selection_hierarchical(storage, console)
+        if not selected_day:
+            continue
+        
+        return selected_day
+
+
+def status_checkbox(status) -> str:
+    """Get the checkbox shown for a task status.
     
-    # Step 4: Select Day
-    days = hierarchy[selected_year][selected_month][selected_week]
+    Args:
+        status: 'done', 'quit', None/pending, or a legacy bool
     
-    if len(days) == 1:
-        return days[0][0]  # Return the date string
+    Returns:
+        Checkbox string: [✓], [✗] or [ ]
+    """
+    # Three states: pending [ ], done [✓], quit [✗]
+    if status == 'done' or status is True:  # Support legacy bool format
+        return "[✓]"
+    elif status == 'quit':
+        return "[✗]"
+    return "[ ]"
+
+
+# Indent prefixes by depth; deeper levels fall back to building the string
+_INDENTS = tuple("  " * depth for depth in range(16))
+
+
+def flatten_jobs(jobs: list, depth: int = 0) -> tuple:
+    """Flatten the job tree into display order.
     
-    day_choices = []
-    for date_str, _ in sorted(days, reverse=True):
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            day_name = date_obj.strftime("%A, %b %d")
-            day_choices.append(Choice(f"📄 {day_name}", value=date_str))
-        except:
-            day_choices.append(Choice(date_str, value=date_str))
+    Resolves each job's name once so later passes don't repeat the dict probes.
     
-    day_choices.append(Choice("← Back", value=None))
+    Args:
+        jobs: List of job dictionaries
+        depth: Depth level of the given jobs
     
-    selected_day = questionary.select(
-        "Select day:",
-        choices=day_choices
-    ).ask()
+    Returns:
+        Tuple of parallel lists (names, depths)
+    """
+    names = []
+    depths = []
+    # Explicit stack of (job, depth), pushed in reverse to keep display order
+    stack = [(job, depth) for job in reversed(jobs)]
     
-    if not selected_day:
-        return display_plan_selection_hierarchical(storage, console)
+    while stack:
+        job, level = stack.pop()
+        names.append(job.get('name') or job.get('task_name', 'Unknown'))
+        depths.append(level)
+        
+        sub_jobs = job.get('sub_jobs')
+        if sub_jobs:
+            stack.extend((sub_job, level + 1) for sub_job in reversed(sub_jobs))
     
-    return selected_day
+    return names, depths
 
 
-def build_task_tree(jobs: list, completion_status: dict, depth: int = 0) -> list:
+def build_task_tree(jobs: list, completion_status: dict, depth: int = 0,
+                    index: Optional[dict] = None) -> list:
     """Build hierarchical task choices for questionary.
     
     Args:
         jobs: List of job dictionaries
         completion_status: Dict of job_name -> status ('done', 'quit', or None/pending)
         depth: Current depth level
+        index: Optional dict filled with job_name -> list of its Choice objects
     
     Returns:
         List of Choice objects
     """
-    choices = []
-    indent = "  " * depth
+    from questionary import Choice
     
-    for job in jobs:
-        job_name = job.get('name') or job.get('task_name', 'Unknown')
-        status = completion_status.get(job_name)
-        
-        # Three states: pending [ ], done [✓], quit [✗]
-        if status == 'done' or status is True:  # Support legacy bool format
-            checkbox = "[✓]"
-        elif status == 'quit':
-            checkbox = "[✗]"
-        else:
-            checkbox = "[ ]"
-        
-        choice_text = f"{indent}{checkbox} {job_name}"
-        choices.append(Choice(choice_text, value=job_name))
-        
-        # Add sub-jobs
-        sub_jobs = job.get('sub_jobs', [])
-        if sub_jobs:
-            sub_choices = build_task_tree(sub_jobs, completion_status, depth + 1)
-            choices.extend(sub_choices)
+    names, depths = flatten_jobs(jobs, depth)
+    get_status = completion_status.get
+    max_depth = len(_INDENTS)
+    
+    choices = [
+        Choice(
+            (_INDENTS[level] if level < max_depth else "  " * level)
+            + status_checkbox(get_status(job_name)) + " " + job_name,
+            value=job_name
+        )
+        for job_name, level in zip(names, depths)
+    ]
+    
+    if index is not None:
+        for choice in choices:
+            index.setdefault(choice.value, []).append(choice)
     
     return choices
 
 
+@lru_cache(maxsize=None)
+def _menu_footer() -> tuple:
+    """Get the separator and exit choices shared by every task menu.
+    
+    Built on first use so questionary stays a lazy import.
+    
+    Returns:
+        Tuple of (separator Choice, exit Choice)
+    """
+    from questionary import Choice
+    
+    return (
+        Choice("─" * 40, disabled=True),
+        Choice("💾 Save and exit", value="__EXIT__"),
+    )
+
+
 def mark_tasks_interactive(plan_data: dict, console: Console) -> dict:
     """Interactively mark tasks using arrow key navigation.
     
@@ -211,25 +295,31 @@ def mark_tasks_interactive(plan_data: dict, console: Console) -> dict:
     Returns:
         Updated plan data with completion marks
     """
+    import questionary
+    
     if 'completion_status' not in plan_data:
         plan_data['completion_status'] = {}
     
     completion = plan_data['completion_status']
     jobs = plan_data.get('jobs', [])
     
+    # Build the task tree once; toggles only rewrite the affected titles
+    choices_by_name = {}
+    choices = build_task_tree(jobs, completion, index=choices_by_name)
+    choices.extend(_menu_footer())
+    
+    console.print("\n[bold green]Use arrow keys to navigate, Enter to cycle status[/bold green]")
+    console.print("[dim]States: [ ] pending → [✓] done → [✗] quit → [ ] pending[/dim]")
+    
+    # Reopen the menu on the last toggled task so it can be cycled again with Enter
+    last_choice = None
+    
     while True:
-        # Build task tree
-        choices = build_task_tree(jobs, completion)
-        choices.append(Choice("─" * 40, disabled=True))
-        choices.append(Choice("💾 Save and exit", value="__EXIT__"))
-        
         # Show menu
-        console.print("\n[bold green]Use arrow keys to navigate, Enter to cycle status[/bold green]")
-        console.print("[dim]States: [ ] pending → [✓] done → [✗] quit → [ ] pending[/dim]")
-        
         selected = questionary.select(
             "Select a task to toggle:",
             choices=choices,
+            default=last_choice,
             use_arrow_keys=True
         ).ask()
         
@@ -254,6 +344,13 @@ def mark_tasks_interactive(plan_data: dict, console: Console) -> dict:
         else:  # quit -> pending
             completion[selected] = None
             console.print(f"[yellow]'{selected}' marked as pending[/yellow]")
+        
+        # Same-named tasks share a status, so update every matching entry
+        checkbox = status_checkbox(completion[selected])
+        for choice in choices_by_name[selected]:
+            pos = choice.title.index("[")
+            choice.title = f"{choice.title[:pos]}{checkbox}{choice.title[pos + 3:]}"
+        last_choice = choices_by_name[selected][0]
     
     plan_data['completion_status'] = completion
     plan_data['last_checked'] = datetime.now().isoformat()
@@ -261,69 +358,55 @@ def mark_tasks_interactive(plan_data: dict, console: Console) -> dict:
     return plan_data
 
 
-def count_all_tasks(jobs: list) -> int:
-    """Recursively count all tasks including sub-jobs.
-    
-    Args:
-        jobs: List of job dictionaries
-        
-    Returns:
-        Total number of tasks
-    """
-    count = len(jobs)
-    for job in jobs:
-        sub_jobs = job.get('sub_jobs', [])
-        if sub_jobs:
-            count += count_all_tasks(sub_jobs)
-    return count
-
-
-def count_completed_tasks(jobs: list, completion_status: dict) -> int:
-    """Recursively count completed tasks including sub-jobs.
+def count_task_stats(jobs: list, completion_status: dict) -> tuple:
+    """Count total, completed and quit tasks including sub-jobs in one pass.
     
     Args:
         jobs: List of job dictionaries
         completion_status: Dict of job_name -> status ('done', 'quit', or None)
         
     Returns:
-        Number of completed tasks
+        Tuple of (total, completed, quit_count)
     """
-    count = 0
-    for job in jobs:
-        job_name = job.get('name') or job.get('task_name', 'Unknown')
-        status = completion_status.get(job_name)
+    stack = list(jobs)
+    push = stack.extend
+    # Every job pushed is counted once, so total falls out of the push count
+    total = len(stack)
+    
+    # Nothing marked yet (fresh plan): only the total needs the walk
+    if not completion_status:
+        while stack:
+            sub_jobs = stack.pop().get('sub_jobs')
+            if sub_jobs:
+                total += len(sub_jobs)
+                push(sub_jobs)
+        return total, 0, 0
+    
+    completed = quit_count = 0
+    completion_get = completion_status.get
+    while stack:
+        job = stack.pop()
+        job_get = job.get
+        
+        status = completion_get(job_get('name') or job_get('task_name', 'Unknown'))
         # Count 'done' tasks (support legacy bool format)
         if status == 'done' or status is True:
-            count += 1
+            completed += 1
+        elif status == 'quit':
+            quit_count += 1
         
-        sub_jobs = job.get('sub_jobs', [])
+        sub_jobs = job_get('sub_jobs')
         if sub_jobs:
-            count += count_completed_tasks(sub_jobs, completion_status)
+            total += len(sub_jobs)
+            push(sub_jobs)
     
-    return count
+    return total, completed, quit_count
 
 
-def count_quit_tasks(jobs: list, completion_status: dict) -> int:
-    """Recursively count quit tasks including sub-jobs.
-    
-    Args:
-        jobs: List of job dictionaries
-        completion_status: Dict of job_name -> status ('done', 'quit', or None)
-        
-    Returns:
-        Number of quit tasks
-    """
-    count = 0
-    for job in jobs:
-        job_name = job.get('name') or job.get('task_name', 'Unknown')
-        if completion_status.get(job_name) == 'quit':
-            count += 1
-        
-        sub_jobs = job.get('sub_jobs', [])
-        if sub_jobs:
-            count += count_quit_tasks(sub_jobs, completion_status)
-    
-    return count
+# Summary progress bar width and its glyph runs, sliced to each segment's width
+_BAR_WIDTH = 30
+_BAR_FULL = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
 
 
 def display_completion_summary(plan_data: dict, console: Console):
@@ -333,13 +416,13 @@ def display_completion_summary(plan_data: dict, console: Console):
         plan_data: Plan data dictionary
         console: Rich console
     """
+    from rich.table import Table
+    
     completion = plan_data.get('completion_status', {})
     jobs = plan_data.get('jobs', [])
     
     # Count all tasks including sub-jobs
-    total = count_all_tasks(jobs)
-    completed = count_completed_tasks(jobs, completion)
-    quit_count = count_quit_tasks(jobs, completion)
+    total, completed, quit_count = count_task_stats(jobs, completion)
     
     # Create summary table
     table = Table(title="Completion Summary", show_header=True, header_style="bold green")
@@ -366,9 +449,9 @@ def display_completion_summary(plan_data: dict, console: Console):
     percentage = completed * 100 // total if total > 0 else 0
     
     # Create visual progress bar with three sections
-    bar_width = 30
-    done_width = int(bar_width * completed / total) if total > 0 else 0
-    quit_width = int(bar_width * quit_count / total) if total > 0 else 0
+    bar_width = _BAR_WIDTH
+    done_width = bar_width * completed // total if total > 0 else 0
+    quit_width = bar_width * quit_count // total if total > 0 else 0
     pending_width = bar_width - done_width - quit_width
     
     # Color based on progress (completed tasks only)
@@ -385,7 +468,11 @@ def display_completion_summary(plan_data: dict, console: Console):
         bar_color = "cyan"
         emoji = "📋"
     
-    progress_bar = f"[{bar_color}]{'█' * done_width}[/{bar_color}][red]{'█' * quit_width}[/red][dim]{'░' * pending_width}[/dim]"
+    progress_bar = (
+        f"[{bar_color}]{_BAR_FULL[:done_width]}[/{bar_color}]"
+        f"[red]{_BAR_FULL[:quit_width]}[/red]"
+        f"[dim]{_BAR_EMPTY[:pending_width]}[/dim]"
+    )
     
     # Show stats
     pending = total - completed - quit_count
@@ -393,6 +480,24 @@ def display_completion_summary(plan_data: dict, console: Console):
     console.print(f"\n[bold]Progress:[/bold] {progress_bar} {stats} ({percentage}% done) {emoji}")
 
 
+@lru_cache(maxsize=32)
+def render_plan_panel(content: str) -> Panel:
+    """Build the plan content panel, reusing it for identical content.
+    
+    Parsing the markdown is the expensive part, so panels are cached by
+    the content string.
+    
+    Args:
+        content: Plan markdown content
+    
+    Returns:
+        Rich Panel with the rendered markdown
+    """
+    from rich.markdown import Markdown
+    
+    return Panel(Markdown(content), border_style="cyan")
+
+
 def main():
     """Main check workflow."""
     console = Console()
@@ -416,7 +521,7 @@ def main():
             return
         
         # Load plan
-        date_obj = datetime.strptime(selected_date, "%Y-%m-%d")
+        date_obj = fast_parse_date(selected_date)
         plan_data = storage.load_plan(date_obj)
         
         if not plan_data:
@@ -425,10 +530,7 @@ def main():
         
         # Display plan content
         console.print(f"\n[bold cyan]Plan for {selected_date}:[/bold cyan]")
-        console.print(Panel(
-            Markdown(plan_data.get('plan_content', 'No content')),
-            border_style="cyan"
-        ))
+        console.print(render_plan_panel(plan_data.get('plan_content', 'No content')))
         
         # Mark tasks interactively
         plan_data = mark_tasks_interactive(plan_data, console)
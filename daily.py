@@ -1,42 +1,51 @@
 #!/usr/bin/env python3
 """Daily Planner & Logger - Unified entry point with enhanced UI."""
+import importlib
+import os
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from lib.storage import Storage
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich.prompt import Prompt
-import questionary
-from questionary import Choice
 
 # Import calendar and goals functions
 from calendar_view import (
     get_contribution_data,
     get_intensity_level,
-    get_block_style,
+    BLOCK_STYLE_TABLE,
+    WEEKDAY_ABBR,
+    MONTH_ABBR,
     load_goals,
+    GOALS_FILE,
     display_goals,
     get_priority_emoji,
+    get_priority_rank,
     get_stage_info
 )
 
 
-def display_mini_calendar(storage: Storage, console: Console, weeks: int = 16):
-    """Display a compact contribution calendar.
+def build_mini_calendar_panel(storage: Storage, weeks: int = 16) -> Panel:
+    """Build a compact contribution calendar panel.
     
     Args:
         storage: Storage instance
-        console: Rich console
         weeks: Number of weeks to show (default 16 for ~4 months)
+    
+    Returns:
+        Rich Panel with the calendar
     """
     contributions = get_contribution_data(storage, weeks)
     
@@ -67,16 +76,26 @@ def display_mini_calendar(storage: Storage, console: Console, weeks: int = 16):
             month_positions.append((week, month_name))
             prev_month = week_start.month
     
-    # Create month header line
-    month_line = ["    "]
+    # Create month header line by writing each name into a row of spaces
+    month_line = bytearray(b" " * (4 + weeks * 2 + 4 * len(month_positions)))
+    cursor = 4
     last_pos = 0
     for pos, month_name in month_positions:
-        spaces_needed = pos - last_pos
-        month_line.append(" " * (spaces_needed * 2))
-        month_line.append(month_name)
+        start = cursor + (pos - last_pos) * 2
+        cursor = start + len(month_name)
+        month_line[start:cursor] = month_name.encode()
         last_pos = pos + len(month_name) // 2
     
-    calendar_lines.append(Text("".join(month_line), style="dim"))
+    calendar_lines.append(Text(month_line[:cursor].decode(), style="dim"))
+    
+    # Precompute one "YYYY-MM-DD" key per cell, indexed by week * 7 + day_idx
+    start_ord = start_date.toordinal()
+    today_ord = date.today().toordinal()
+    keys = [
+        f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+        for d in map(date.fromordinal, range(start_ord, start_ord + weeks * 7))
+    ]
+    contrib_get = contributions.get
     
     # Build each day row (7 rows for each day of week)
     day_labels = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
@@ -84,25 +103,26 @@ def display_mini_calendar(storage: Storage, console: Console, weeks: int = 16):
         row = Text()
         
         # Day label (only show Mon, Wed, Fri)
-        if day_idx in [1, 3, 5]:
+        if day_idx in (1, 3, 5):
             row.append(f"{day_labels[day_idx][0]} ", style="dim")
         else:
             row.append("  ")
         
         # Add each week's cell for this day
         for week in range(weeks):
-            cell_date = start_date + timedelta(weeks=week, days=day_idx)
-            date_str = cell_date.strftime("%Y-%m-%d")
+            offset = week * 7 + day_idx
+            data = contrib_get(keys[offset])
             
-            if date_str in contributions:
-                data = contributions[date_str]
-                intensity = get_intensity_level(data['completed'], data['total'])
-                char, style = get_block_style(intensity, data['has_plan'])
+            if data is not None:
+                char, style = BLOCK_STYLE_TABLE[
+                    get_intensity_level(data['completed'], data['total']), data['has_plan']
+                ]
                 
                 # Special styling for today
-                if cell_date.date() == datetime.now().date():
+                cell_ord = start_ord + offset
+                if cell_ord == today_ord:
                     row.append("◉", style="bold cyan")
-                elif cell_date > datetime.now():
+                elif cell_ord > today_ord:
                     row.append(" ")
                 else:
                     row.append(char, style=style)
@@ -131,50 +151,77 @@ def display_mini_calendar(storage: Storage, console: Console, weeks: int = 16):
     
     content = Text("\n").join(calendar_lines)
     
-    console.print(Panel(
+    return Panel(
         content,
         title="[bold cyan]📅 Recent Activity[/bold cyan]",
         subtitle=f"[dim]{start_date.strftime('%b')} - {end_date.strftime('%b %Y')}[/dim]",
         border_style="cyan",
         padding=(0, 1)
-    ))
+    )
 
 
-def display_upcoming_tasks(storage: Storage, console: Console, config: Any):
-    """Display upcoming tasks panel.
-
+def display_mini_calendar(storage: Storage, console: Console, weeks: int = 16):
+    """Display a compact contribution calendar.
+    
     Args:
         storage: Storage instance
         console: Rich console
+        weeks: Number of weeks to show (default 16 for ~4 months)
+    """
+    console.print(build_mini_calendar_panel(storage, weeks))
+
+
+@lru_cache(maxsize=128)
+def _format_upcoming_line(job_name: str, desc: str, is_subtask: bool) -> str:
+    """Format one task row of the upcoming tasks panel.
+
+    Args:
+        job_name: Task name
+        desc: Task description
+        is_subtask: Whether the task is nested under another job
+
+    Returns:
+        Rich markup line
+    """
+    indent = "  " if not is_subtask else "    "
+
+    # Truncate long descriptions
+    if len(desc) > 50:
+        desc = desc[:47] + "..."
+
+    return f"{indent}• {job_name}: {desc}"
+
+
+def build_upcoming_tasks_panel(storage: Storage, config: Any) -> Panel:
+    """Build the upcoming tasks panel.
+
+    Args:
+        storage: Storage instance
         config: Config loader instance
+
+    Returns:
+        Rich Panel listing upcoming tasks
     """
     # Get number of days from config
     preferences = config.get_preferences()
     days = preferences.get('upcoming_days', 7)
 
-    upcoming = storage.get_upcoming_tasks(days=days)
+    by_date = storage.get_upcoming_tasks_grouped(days=days)
 
-    if not upcoming:
-        console.print(Panel(
+    if not by_date:
+        return Panel(
             "[dim]No upcoming tasks scheduled.[/dim]",
             title="[bold cyan]📅 Upcoming Tasks[/bold cyan]",
             border_style="cyan",
             padding=(0, 1)
-        ))
-        return
-
-    # Group by date
-    from collections import defaultdict
-    by_date = defaultdict(list)
-    for task in upcoming:
-        by_date[task['date_str']].append(task)
+        )
 
     # Build display
     lines = []
     today = datetime.now().date()
 
-    for date_str in sorted(by_date.keys()):
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+    for date_str, tasks in by_date.items():
+        date_obj = date.fromisoformat(date_str)
 
         # Format date label
         days_away = (date_obj - today).days
@@ -188,74 +235,133 @@ def display_upcoming_tasks(storage: Storage, console: Console, config: Any):
         lines.append(f"[bold cyan]{date_label}[/bold cyan]")
 
         # Show tasks for this date
-        for task in by_date[date_str]:
-            indent = "  " if not task['is_subtask'] else "    "
-            job_name = task['job_name']
-            desc = task['task_description']
-
-            # Truncate long descriptions
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
-
-            lines.append(f"{indent}• {job_name}: {desc}")
+        lines.extend(
+            _format_upcoming_line(task['job_name'], task['task_description'], task['is_subtask'])
+            for task in tasks
+        )
 
         lines.append("")  # Blank line between dates
 
     content = "\n".join(lines).rstrip()
 
-    console.print(Panel(
+    return Panel(
         content,
         title=f"[bold cyan]📅 Upcoming Tasks (Next {days} Days)[/bold cyan]",
         border_style="cyan",
         padding=(0, 1)
-    ))
+    )
 
 
-def display_goals_compact(console: Console):
-    """Display compact goals panel for main UI with stages.
-    
+def display_upcoming_tasks(storage: Storage, console: Console, config: Any):
+    """Display upcoming tasks panel.
+
     Args:
+        storage: Storage instance
         console: Rich console
+        config: Config loader instance
+    """
+    console.print(build_upcoming_tasks_panel(storage, config))
+
+
+@lru_cache(maxsize=128)
+def _format_goal_line(name: str, progress: int, priority: str) -> str:
+    """Format one goal row of the compact goals panel.
+    
+    Args:
+        name: Goal name
+        progress: Progress percentage (0-100)
+        priority: Goal priority
+    
+    Returns:
+        Rich markup line
+    """
+    stage_name, stage_emoji, stage_color = get_stage_info(progress)
+    
+    bar_width = 6
+    filled = int(bar_width * progress / 100)
+    empty = bar_width - filled
+    
+    priority = get_priority_emoji(priority)
+    bar = f"[{stage_color}]{'█' * filled}[/{stage_color}][dim]{'░' * empty}[/dim]"
+    return f"  {priority} {name[:20]:20} [{stage_color}]{stage_emoji}[/{stage_color}] {bar} {progress}%"
+
+
+def build_goals_compact_panel() -> Panel:
+    """Build the compact goals panel for main UI with stages.
+    
+    Returns:
+        Rich Panel with the top active goals
     """
     goals_data = load_goals()
     active_goals = [g for g in goals_data.get("goals", []) if g.get("status") == "active"]
     
     if not active_goals:
-        console.print(Panel(
+        return Panel(
             "[dim]No goals set. Use 🎯 Manage goals to add some![/dim]",
             title="[bold cyan]🎯 Goals[/bold cyan]",
             border_style="cyan",
             padding=(0, 1)
-        ))
-        return
+        )
     
     # Sort by priority
-    priority_order = {"high": 0, "medium": 1, "low": 2}
-    active_goals.sort(key=lambda x: priority_order.get(x.get("priority", "low"), 3))
+    active_goals.sort(key=get_priority_rank)
     
     # Show top 5 goals with stages
-    goals_text = []
-    for goal in active_goals[:5]:
-        progress = goal.get("progress", 0)
-        stage_name, stage_emoji, stage_color = get_stage_info(progress)
-        
-        bar_width = 6
-        filled = int(bar_width * progress / 100)
-        empty = bar_width - filled
-        
-        priority = get_priority_emoji(goal.get("priority", "low"))
-        bar = f"[{stage_color}]{'█' * filled}[/{stage_color}][dim]{'░' * empty}[/dim]"
-        goals_text.append(f"  {priority} {goal['name'][:20]:20} [{stage_color}]{stage_emoji}[/{stage_color}] {bar} {progress}%")
+    goals_text = [
+        _format_goal_line(goal['name'], goal.get("progress", 0), goal.get("priority", "low"))
+        for goal in active_goals[:5]
+    ]
     
     if len(active_goals) > 5:
         goals_text.append(f"  [dim]... and {len(active_goals) - 5} more[/dim]")
     
-    console.print(Panel(
+    return Panel(
         "\n".join(goals_text),
         title="[bold cyan]🎯 Goals[/bold cyan]",
         border_style="cyan",
         padding=(0, 1)
-    ))
+    )
+
+
+def display_goals_compact(console: Console):
+    """Display compact goals panel for main UI with stages.
+    
+    Args:
+        console: Rich console
+    """
+    console.print(build_goals_compact_panel())
+
+
+# Today's stats for the last seen (plan filename, mtime); the filename encodes the date
+_stats_cache = {}
+
+
+def get_today_stats_cached(storage: Storage) -> dict:
+    """Get today's task stats, re-reading the plan only when it changed.
+    
+    Args:
+        storage: Storage instance
+    
+    Returns:
+        Dict with 'completed', 'quit', 'pending', 'total' counts
+    """
+    plan_path = storage.get_plan_path()
+    try:
+        mtime = plan_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    
+    key = (plan_path.name, mtime)
+    stats = _stats_cache.get(key)
+    if stats is None:
+        stats = storage.get_today_stats()
+        _stats_cache.clear()
+        _stats_cache[key] = stats
+    return stats
+
+
+# Last built dashboard panels and the inputs they were drawn from
+_dashboard_cache = {}
 
 
 def display_dashboard(storage: Storage, console: Console):
@@ -265,7 +371,6 @@ def display_dashboard(storage: Storage, console: Console):
         storage: Storage instance
         console: Rich console
     """
-    console.clear()
     now = datetime.now()
     
     # Date and time formatting
@@ -273,7 +378,7 @@ def display_dashboard(storage: Storage, console: Console):
     time_str = now.strftime("%I:%M %p")
     
     # Get today's stats
-    stats = storage.get_today_stats()
+    stats = get_today_stats_cached(storage)
     total = stats['total']
     completed = stats['completed']
     quit_count = stats['quit']
@@ -321,38 +426,60 @@ def display_dashboard(storage: Storage, console: Console):
             streak_text = f"[bold magenta]🏆 {streak}-day streak! Legend![/bold magenta]"
         header_lines.append(streak_text)
     
-    # Print header
-    console.print("\n")
-    console.print(Panel(
-        "\n".join(header_lines),
-        border_style="cyan",
-        padding=(0, 2)
-    ))
+    header_text = "\n".join(header_lines)
     
-    # Display mini calendar
-    display_mini_calendar(storage, console, weeks=16)
-
-    # Display upcoming tasks
-    from lib.config_loader import load_config
-    config = load_config()
-    display_upcoming_tasks(storage, console, config)
-
-    # Display goals
-    display_goals_compact(console)
+    from lib.config_loader import load_config_cached
+    config = load_config_cached()
+    days = config.get_preferences().get('upcoming_days', 7)
+    
+    # Everything the panels below the header are drawn from
+    try:
+        goals_stat = GOALS_FILE.stat()
+        goals_key = (goals_stat.st_mtime_ns, goals_stat.st_size)
+    except FileNotFoundError:
+        goals_key = None
+    plan_mtimes = storage.get_plan_mtimes(now - timedelta(weeks=18), now + timedelta(days=days))
+    key = (now.date(), days, goals_key, tuple(plan_mtimes.items()))
+    
+    if _dashboard_cache.get("key") != key:
+        # The panels read independent files, so let their disk I/O overlap
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            calendar_future = executor.submit(build_mini_calendar_panel, storage, 16)
+            upcoming_future = executor.submit(build_upcoming_tasks_panel, storage, config)
+            goals_future = executor.submit(build_goals_compact_panel)
+        _dashboard_cache["panels"] = (
+            calendar_future.result(),
+            upcoming_future.result(),
+            goals_future.result()
+        )
+        _dashboard_cache["key"] = key
+    
+    # The header shows the clock, so it is rebuilt on every redraw
+    dashboard = Group(
+        Text("\n"),
+        Panel(header_text, border_style="cyan", padding=(0, 2)),
+        *_dashboard_cache["panels"]
+    )
+    
+    # Clear and repaint in one buffered write, so the screen is never left
+    # blank while the dashboard is drawn
+    with console:
+        console.clear()
+        console.print(dashboard)
 
 
-def show_menu(console: Console) -> str:
-    """Display main menu and get user choice.
+@lru_cache(maxsize=None)
+def _menu_choices() -> tuple:
+    """Get the main menu choices, shared by every menu cycle.
+    
+    Built on first use so questionary stays a lazy import.
     
-    Args:
-        console: Rich console
-        
     Returns:
-        User's choice as string
+        Tuple of menu Choices
     """
-    console.print("\n[bold]Use arrow keys ↑↓ to navigate, Enter to select[/bold]\n")
+    from questionary import Choice
     
-    choices = [
+    return (
         Choice("🌅 Plan my day", value="plan"),
         Choice("✅ Check tasks", value="check"),
         Choice("📝 Add future task", value="future_task"),
@@ -362,17 +489,35 @@ def show_menu(console: Console) -> str:
         Choice("📅 Full calendar view", value="calendar"),
         Choice("🎯 Manage goals", value="goals"),
         Choice("❌ Exit", value="exit")
-    ]
+    )
+
+
+def show_menu(console: Console) -> str:
+    """Display main menu and get user choice.
+    
+    Args:
+        console: Rich console
+        
+    Returns:
+        User's choice as string
+    """
+    import questionary
+    
+    console.print("\n[bold]Use arrow keys ↑↓ to navigate, Enter to select[/bold]\n")
     
     result = questionary.select(
         "What would you like to do?",
-        choices=choices,
+        choices=list(_menu_choices()),
         use_arrow_keys=True
     ).ask()
     
     return result if result else "exit"
 
 
+# Date choices of add_future_task and the day ordinal they were built for
+_future_date_choices = {}
+
+
 def add_future_task(storage: Storage, console: Console):
     """Add a task for a future date.
 
@@ -380,31 +525,41 @@ def add_future_task(storage: Storage, console: Console):
         storage: Storage instance
         console: Rich console
     """
+    import questionary
+    from questionary import Choice
+
     console.print("\n[bold cyan]📝 Add Future Task[/bold cyan]\n")
 
     # Select date
     console.print("[dim]Select a date for this task:[/dim]")
     today = datetime.now()
 
-    date_choices = []
-    for i in range(1, 15):  # Next 14 days
-        future_date = today + timedelta(days=i)
-        label = future_date.strftime("%a, %b %d, %Y")
-        if i == 1:
-            label = f"Tomorrow ({future_date.strftime('%b %d')})"
-        date_choices.append(Choice(label, value=future_date))
-
-    date_choices.append(Choice("❌ Cancel", value=None))
-
-    selected_date = questionary.select(
+    # The labels only change when the date rolls over
+    today_ord = today.toordinal()
+    if _future_date_choices.get("ordinal") != today_ord:
+        date_choices = []
+        for i in range(1, 15):  # Next 14 days
+            d = date.fromordinal(today_ord + i)
+            label = f"{WEEKDAY_ABBR[d.weekday()]}, {MONTH_ABBR[d.month]} {d.day:02d}, {d.year}"
+            if i == 1:
+                label = f"Tomorrow ({MONTH_ABBR[d.month]} {d.day:02d})"
+            date_choices.append(Choice(label, value=i))
+
+        date_choices.append(Choice("❌ Cancel", value=None))
+        _future_date_choices["ordinal"] = today_ord
+        _future_date_choices["choices"] = date_choices
+
+    days_ahead = questionary.select(
         "Choose date:",
-        choices=date_choices,
+        choices=_future_date_choices["choices"],
         use_arrow_keys=True
     ).ask()
 
-    if not selected_date:
+    if not days_ahead:
         return
 
+    selected_date = today + timedelta(days=days_ahead)
+
     # Load or create plan for that date
     plan_data = storage.load_plan(selected_date)
 
@@ -419,8 +574,8 @@ def add_future_task(storage: Storage, console: Console):
         }
 
     # Get job category
-    from lib.config_loader import load_config
-    config = load_config()
+    from lib.config_loader import load_config_cached
+    config = load_config_cached()
     daily_jobs = config.get_daily_jobs()
 
     job_choices = [Choice(job['name'], value=job) for job in daily_jobs]
@@ -465,8 +620,66 @@ def add_future_task(storage: Storage, console: Console):
     console.print(f"\n[green]✅ Task added to {selected_date.strftime('%A, %B %d')}![/green]")
 
 
+def _run_script_subprocess(script_path: Path, console: Console):
+    """Run a script in a separate Python interpreter.
+    
+    Args:
+        script_path: Path to the script
+        console: Rich console
+    """
+    # close_fds=False lets CPython use posix_spawn (vfork-style) instead of
+    # fork+exec; our own descriptors are non-inheritable by default anyway
+    result = subprocess.run(
+        [sys.executable, str(script_path)],
+        check=False,
+        close_fds=False
+    )
+    
+    if result.returncode != 0:
+        console.print(f"\n[yellow]Script exited with code {result.returncode}[/yellow]")
+
+
+# Menu choice -> (script run by run_script, status line shown as it starts)
+_SCRIPT_ACTIONS = {
+    "plan": ("plan.py", Text("Starting morning planning...", style="dim")),
+    "check": ("check.py", Text("Opening task checker...", style="dim")),
+    "summarize": ("summarize.py", Text("Starting evening summary...", style="dim")),
+    "feedback": ("feedback.py", Text("Opening feedback viewer...", style="dim")),
+    "calendar": ("calendar_view.py", Text("Opening contribution calendar...", style="dim")),
+}
+
+# Menu scripts run in-process by run_script, imported ahead of time by prewarm_scripts
+MENU_SCRIPTS = tuple(script_name for script_name, _ in _SCRIPT_ACTIONS.values())
+
+# Slow imports the menu scripts need, loaded by prewarm_scripts before the scripts
+_PREWARM_MODULES = ("lib.deepseek_client", "lib.config_loader", "rich.markdown", "rich.prompt")
+
+
+def prewarm_scripts():
+    """Import the menu scripts and their heavy dependencies in a background thread.
+    
+    Called once the first dashboard is on screen, so the warm-up overlaps with
+    the user reading the menu instead of delaying the first render. The first
+    pick of each menu entry then finds the OpenAI client and its module
+    already loaded.
+    """
+    def warm():
+        modules = _PREWARM_MODULES + tuple(Path(name).stem for name in MENU_SCRIPTS)
+        for module_name in modules:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                pass  # run_script reports problems when the script is actually used
+    
+    threading.Thread(target=warm, name="prewarm-scripts", daemon=True).start()
+
+
 def run_script(script_name: str, console: Console):
-    """Run a script using subprocess.
+    """Run a script's main() in this process.
+    
+    Importing the script once and calling its main() avoids starting a new
+    interpreter (and re-importing rich, questionary, etc.) on every menu
+    pick. Scripts that can't be imported fall back to a subprocess.
     
     Args:
         script_name: Name of the script to run (e.g., 'plan.py')
@@ -479,51 +692,90 @@ def run_script(script_name: str, console: Console):
         return
     
     try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            check=False
-        )
-        
-        if result.returncode != 0:
-            console.print(f"\n[yellow]Script exited with code {result.returncode}[/yellow]")
+        # Cached in sys.modules after the first import
+        module = importlib.import_module(script_path.stem)
+        script_main = module.main
+    except Exception:
+        module = None
     
+    try:
+        if module is None:
+            _run_script_subprocess(script_path, console)
+        else:
+            script_main()
+    
+    except SystemExit as e:
+        # Scripts call sys.exit(1) on errors; report it like a child exit code
+        if e.code not in (None, 0):
+            console.print(f"\n[yellow]Script exited with code {e.code}[/yellow]")
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
     except Exception as e:
         console.print(f"[red]Error running {script_name}: {e}[/red]")
+        import traceback
+        traceback.print_exc()
+
+
+def wait_for_key():
+    """Wait for a single keypress on a terminal.
+    
+    Falls back to reading a whole line when stdin is not a terminal or
+    termios is unavailable (e.g. on Windows).
+    """
+    try:
+        import termios
+        import tty
+    except ImportError:
+        input()
+        return
+    
+    try:
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+    except (OSError, ValueError, termios.error):
+        input()
+        return
+    
+    try:
+        # cbreak keeps Ctrl+C working; read a chunk so multi-byte keys like
+        # arrows are consumed whole instead of leaking into the next prompt
+        tty.setcbreak(fd)
+        os.read(fd, 32)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
+_RETURN_PROMPT = Text("Press any key to return to menu...", style="dim")
+_CONTINUE_PROMPT = Text("Press any key to continue...", style="dim")
 
 
 def main():
     """Main menu loop."""
     console = Console()
     storage = Storage()
+    prewarmed = False
     
     while True:
         # Show enhanced dashboard with calendar and goals
         display_dashboard(storage, console)
+        if not prewarmed:
+            prewarm_scripts()
+            prewarmed = True
         
         # Show menu
         choice = show_menu(console)
         
-        if choice == "plan":
-            console.print("\n[dim]Starting morning planning...[/dim]\n")
-            run_script("plan.py", console)
-        
-        elif choice == "check":
-            console.print("\n[dim]Opening task checker...[/dim]\n")
-            run_script("check.py", console)
-        
-        elif choice == "summarize":
-            console.print("\n[dim]Starting evening summary...[/dim]\n")
-            run_script("summarize.py", console)
-        
-        elif choice == "feedback":
-            console.print("\n[dim]Opening feedback viewer...[/dim]\n")
-            run_script("feedback.py", console)
-        
-        elif choice == "calendar":
-            console.print("\n[dim]Opening contribution calendar...[/dim]\n")
-            run_script("calendar_view.py", console)
+        if choice in _SCRIPT_ACTIONS:
+            script_name, status_line = _SCRIPT_ACTIONS[choice]
+            console.line()
+            console.print(status_line)
+            console.line()
+            run_script(script_name, console)
+            
+            # Pause before showing menu again
+            console.line()
+            console.print(_RETURN_PROMPT)
+            wait_for_key()
         
         elif choice == "goals":
             # Import and run goals management
@@ -532,17 +784,13 @@ def main():
 
         elif choice == "future_task":
             add_future_task(storage, console)
-            console.print("\n[dim]Press Enter to continue...[/dim]")
-            input()
+            console.line()
+            console.print(_CONTINUE_PROMPT)
+            wait_for_key()
 
         elif choice == "exit" or choice is None:
             console.print("\n[bold green]Have a great day! 👋[/bold green]\n")
             break
-        
-        # Pause before showing menu again
-        if choice in ["plan", "check", "summarize", "feedback", "calendar"]:
-            console.print("\n[dim]Press Enter to return to menu...[/dim]")
-            input()
 
 
 if __name__ == "__main__":
@@ -1,40 +1,77 @@
 #!/usr/bin/env python3
 """Feedback viewer - display and manage tool improvement suggestions."""
+import hashlib
+import json
+import os
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from lib.config_loader import load_config
-from lib.deepseek_client import DeepSeekClient
 from lib.storage import Storage
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.markdown import Markdown
 from rich.prompt import Prompt
-import questionary
 from datetime import datetime
 
 
-def display_feedback(storage: Storage, console: Console, show_archived: bool = False):
+# Table cell and menu icon for archived entry statuses
+_STATUS_STYLE = {
+    'implemented': '[green]✓ Done[/green]',
+    'dismissed': '[dim]Dismissed[/dim]'
+}
+_STATUS_EMOJI = {'pending': '○', 'implemented': '✓', 'dismissed': '✕'}
+
+# Menu previews longer than _PREVIEW_MAX are cut to _PREVIEW_TRUNC chars plus "..."
+_PREVIEW_MAX = 50
+_PREVIEW_TRUNC = 47
+
+_SEPARATOR = "─" * 40
+
+
+@lru_cache(maxsize=256)
+def make_preview(text: str) -> str:
+    """Shorten feedback text for a one-line menu entry.
+    
+    Cached by text, so redrawing the menu reuses unchanged previews.
+    
+    Args:
+        text: Full feedback text
+    
+    Returns:
+        Text cut to _PREVIEW_TRUNC chars plus "..." if longer than _PREVIEW_MAX
+    """
+    # A non-empty tail slice means the text is longer than _PREVIEW_MAX
+    return text[:_PREVIEW_TRUNC] + "..." if text[_PREVIEW_MAX:] else text
+
+
+def display_feedback(storage: Storage, console: Console, show_archived: bool = False,
+                     pending_entries: list = None):
     """Display feedback entries in a table.
     
     Args:
         storage: Storage instance
         console: Rich console
         show_archived: If True, show archived entries instead of pending
+        pending_entries: Already filtered pending entries (pending view only);
+            loaded from storage if None
     """
     if show_archived:
         feedback_data = storage.load_archived_feedback()
         entries = feedback_data.get('archived_entries', [])
         title = "Archived Feedback (Implemented/Dismissed)"
     else:
-        feedback_data = storage.load_all_feedback()
-        entries = feedback_data.get('feedback_entries', [])
-        # Filter to only pending
-        entries = [e for e in entries if e.get('status', 'pending') == 'pending']
+        if pending_entries is None:
+            feedback_data = storage.load_all_feedback()
+            entries = feedback_data.get('feedback_entries', [])
+            # Filter to only pending
+            pending_entries = [e for e in entries if e.get('status', 'pending') == 'pending']
+        entries = pending_entries
         title = "Pending Feedback"
     
     if not entries:
@@ -53,31 +90,23 @@ def display_feedback(storage: Storage, console: Console, show_archived: bool = F
     table.add_column("Feedback", style="white", width=50)
     
     for i, entry in enumerate(entries):
-        date_str = entry.get('date', 'Unknown')
-        try:
-            date_obj = datetime.fromisoformat(date_str)
-            date_display = date_obj.strftime("%Y-%m-%d")
-        except:
-            date_display = date_str[:10]
+        # Entries are saved with isoformat(), which already starts with the date;
+        # anything else is shown cut to the same width, as before
+        date_display = entry.get('date', 'Unknown')[:10]
         
         original = entry.get('original_feedback', 'N/A')
         # Truncate if too long
-        if len(original) > 47:
+        if original[47:]:
             original = original[:44] + "..."
         
         if show_archived:
             status = entry.get('status', 'pending')
-            status_style = {
-                'implemented': '[green]✓ Done[/green]',
-                'dismissed': '[dim]Dismissed[/dim]'
-            }.get(status, status)
+            status_style = _STATUS_STYLE.get(status, status)
             table.add_row(str(i), date_display, status_style, original)
         else:
             table.add_row(str(i), date_display, original)
     
-    console.print("\n")
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(entries)} entries[/dim]")
+    console.print(Group("\n", table, f"\n[dim]Total: {len(entries)} entries[/dim]"))
     
     return entries
 
@@ -92,47 +121,90 @@ def show_feedback_detail(entry: dict, index: int, console: Console):
     """
     date_str = entry.get('date', 'Unknown')
     try:
-        date_obj = datetime.fromisoformat(date_str)
-        date_display = date_obj.strftime("%Y-%m-%d %H:%M")
-    except:
+        date_display = datetime.fromisoformat(date_str).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
         date_display = date_str
     
-    console.print(f"\n[bold cyan]Feedback Entry #{index}[/bold cyan]")
-    console.print(f"[dim]Date: {date_display}[/dim]")
-    console.print(f"[dim]Status: {entry.get('status', 'pending')}[/dim]\n")
-    
-    # Original feedback
-    console.print("[bold]Your Feedback:[/bold]")
-    console.print(Panel(entry.get('original_feedback', 'N/A'), border_style="yellow"))
-    
-    # AI Understanding
-    console.print("\n[bold]DeepSeek's Understanding:[/bold]")
-    final_understanding = entry.get('final_understanding', 'N/A')
-    console.print(Panel(
-        Markdown(final_understanding),
-        border_style="magenta"
-    ))
+    parts = [
+        f"\n[bold cyan]Feedback Entry #{index}[/bold cyan]",
+        f"[dim]Date: {date_display}[/dim]",
+        f"[dim]Status: {entry.get('status', 'pending')}[/dim]\n",
+        # Original feedback
+        "[bold]Your Feedback:[/bold]",
+        Panel(entry.get('original_feedback', 'N/A'), border_style="yellow"),
+        # AI Understanding
+        "\n[bold]DeepSeek's Understanding:[/bold]",
+        Panel(
+            Markdown(entry.get('final_understanding', 'N/A')),
+            border_style="magenta"
+        ),
+    ]
     
     # Understanding history if exists
     history = entry.get('understanding_history', [])
     if len(history) > 1:
-        console.print(f"\n[dim]({len(history)} refinement iterations)[/dim]")
-        console.print(f"[bold]Understanding History:[/bold]")
+        parts.append(f"\n[dim]({len(history)} refinement iterations)[/dim]")
+        parts.append(f"[bold]Understanding History:[/bold]")
         for i, item in enumerate(history, 1):
-            console.print(f"\n[cyan]Round {i}:[/cyan]")
-            console.print(f"  [dim]You:[/dim] {item['user_input']}")
-            console.print(f"  [dim]AI:[/dim] {item['ai_understanding']}")
+            parts.append(f"\n[cyan]Round {i}:[/cyan]")
+            parts.append(f"  [dim]You:[/dim] {item['user_input']}")
+            parts.append(f"  [dim]AI:[/dim] {item['ai_understanding']}")
+    
+    console.print(Group(*parts))
 
 
-def add_new_feedback(storage: Storage, console: Console):
+def get_understanding(storage: Storage, client, messages: list) -> str:
+    """Ask the AI to restate feedback, reusing answers to identical requests.
+    
+    At temperature 0 the same request gets the same answer, so results are
+    kept in data/.cache/understanding under the SHA-256 of the request.
+    Non-zero temperatures always go to the API.
+    
+    Args:
+        storage: Storage instance
+        client: DeepSeekClient instance
+        messages: Chat messages to send
+    
+    Returns:
+        The AI's understanding as markdown text
+    """
+    if client.temperature_planning != 0:
+        return client.get_completion(messages, use_planning_temp=True)
+    
+    request = json.dumps([messages, client.model, client.max_tokens], sort_keys=True)
+    cache_dir = storage.data_dir / ".cache" / "understanding"
+    cache_path = cache_dir / f"{hashlib.sha256(request.encode('utf-8')).hexdigest()}.txt"
+    try:
+        return cache_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        pass
+    
+    understanding = client.get_completion(messages, use_planning_temp=True)
+    
+    # Write to a temp file and rename, so a partial answer is never cached
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir, delete=False)
+    try:
+        with tmp:
+            tmp.write(understanding)
+        os.replace(tmp.name, cache_path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+    return understanding
+
+
+def add_new_feedback(storage: Storage, console: Console, pending_count: int = None):
     """Add new feedback entry.
     
     Args:
         storage: Storage instance
         console: Rich console
+        pending_count: Number of pending entries, if the caller already knows it
     """
     # Check pending feedback limit
-    pending_count = storage.count_pending_feedback()
+    if pending_count is None:
+        pending_count = storage.count_pending_feedback()
     MAX_PENDING = 10
     
     if pending_count >= MAX_PENDING:
@@ -154,6 +226,9 @@ def add_new_feedback(storage: Storage, console: Console):
     
     # Initialize DeepSeek client
     try:
+        from lib.config_loader import load_config
+        from lib.deepseek_client import DeepSeekClient
+        
         config = load_config()
         deepseek_config = config.get_deepseek_config()
         api_key = config.get_api_key()
@@ -182,6 +257,8 @@ def add_new_feedback(storage: Storage, console: Console):
         console.print("[green]✓ Feedback saved![/green]")
         return
     
+    import questionary
+    
     # AI understanding workflow
     understanding_history = []
     user_description = tool_feedback
@@ -196,7 +273,7 @@ def add_new_feedback(storage: Storage, console: Console):
         ]
         
         try:
-            ai_understanding = client.get_completion(messages, use_planning_temp=True)
+            ai_understanding = get_understanding(storage, client, messages)
         except Exception as e:
             console.print(f"[red]AI error: {e}[/red]")
             break
@@ -257,47 +334,57 @@ def interactive_menu(storage: Storage, console: Console):
         storage: Storage instance
         console: Rich console
     """
+    import questionary
+    from questionary import Choice
+    
     show_archived = False
     
     while True:
         # Display current feedback based on mode
         console.print("\n")
-        entries = display_feedback(storage, console, show_archived=show_archived)
-        
-        # Show pending count limit
-        if not show_archived:
-            pending_count = storage.count_pending_feedback()
-            console.print(f"[dim]Pending: {pending_count}/10 slots used[/dim]")
-        
-        # Build menu choices
-        choices = []
-        
         if show_archived:
-            choices.append("← Back to pending")
+            entries = display_feedback(storage, console, show_archived=True)
         else:
-            choices.append("Add new feedback")
-            choices.append("📁 View archived")
-        
-        choices.append("─" * 40)
-        
-        if entries:
-            # Add view options for each entry
-            for i, entry in enumerate(entries):
-                feedback_preview = entry.get('original_feedback', 'N/A')
-                if len(feedback_preview) > 50:
-                    feedback_preview = feedback_preview[:47] + "..."
-                if show_archived:
-                    status = entry.get('status', 'pending')
-                    status_emoji = {'implemented': '✓', 'dismissed': '✕'}.get(status, '○')
-                    choices.append(f"[{i}] {status_emoji} {feedback_preview}")
-                else:
-                    choices.append(f"[{i}] ○ {feedback_preview}")
+            # Read and filter the feedback file once per redraw; the original
+            # indices are what "Mark as done" archives by
+            feedback_data = storage.load_all_feedback()
+            pending_with_indices = [
+                (i, e) for i, e in enumerate(feedback_data.get('feedback_entries', []))
+                if e.get('status', 'pending') == 'pending'
+            ]
+            entries = display_feedback(
+                storage, console, pending_entries=[e for _, e in pending_with_indices]
+            )
             
-            if not show_archived:
-                choices.append("─" * 40)
-                choices.append("Mark as done (archive)")
+            # Show pending count limit; the pending view lists exactly those entries
+            console.print(f"[dim]Pending: {len(entries)}/10 slots used[/dim]")
         
-        choices.append("Exit")
+        # Build menu choices; entries carry their list index as the value
+        separator = Choice(_SEPARATOR, disabled=True)
+        if show_archived:
+            choices = [Choice("← Back to pending", value="pending"), separator]
+            choices.extend(
+                Choice(
+                    f"[{i}] {_STATUS_EMOJI.get(entry.get('status', 'pending'), '○')} "
+                    f"{make_preview(entry.get('original_feedback', 'N/A'))}",
+                    value=i
+                )
+                for i, entry in enumerate(entries)
+            )
+        else:
+            choices = [
+                Choice("Add new feedback", value="add"),
+                Choice("📁 View archived", value="archived"),
+                separator,
+            ]
+            if entries:
+                choices.extend(
+                    Choice(f"[{i}] ○ {make_preview(entry.get('original_feedback', 'N/A'))}", value=i)
+                    for i, entry in enumerate(entries)
+                )
+                choices += [separator, Choice("Mark as done (archive)", value="mark")]
+        
+        choices.append(Choice("Exit", value="exit"))
         
         # Show menu
         console.print()
@@ -307,53 +394,43 @@ def interactive_menu(storage: Storage, console: Console):
             use_arrow_keys=True
         ).ask()
         
-        if not choice or choice == "Exit":
+        if choice is None or choice == "exit":
             console.print("\n[green]Goodbye![/green]\n")
             break
         
-        elif choice == "← Back to pending":
+        elif choice == "pending":
             show_archived = False
             continue
         
-        elif choice == "📁 View archived":
+        elif choice == "archived":
             show_archived = True
             continue
         
-        elif choice == "Add new feedback":
-            add_new_feedback(storage, console)
+        elif choice == "add":
+            # "Add new feedback" is only offered in the pending view
+            add_new_feedback(storage, console, pending_count=len(entries))
             continue
         
-        elif choice == "Mark as done (archive)":
+        elif choice == "mark":
             if not entries:
                 console.print("[yellow]No pending feedback to mark.[/yellow]")
                 continue
             
-            # Get all pending entries with their original indices
-            feedback_data = storage.load_all_feedback()
-            all_entries = feedback_data.get('feedback_entries', [])
-            pending_with_indices = [(i, e) for i, e in enumerate(all_entries) 
-                                    if e.get('status', 'pending') == 'pending']
-            
-            # Select which entry to mark
-            entry_choices = []
-            for orig_idx, entry in pending_with_indices:
-                feedback_preview = entry.get('original_feedback', 'N/A')
-                if len(feedback_preview) > 50:
-                    feedback_preview = feedback_preview[:47] + "..."
-                entry_choices.append(f"[{orig_idx}] {feedback_preview}")
+            # Select which entry to mark; the value is its index in the feedback file
+            entry_choices = [
+                Choice(f"[{orig_idx}] {make_preview(entry.get('original_feedback', 'N/A'))}", value=orig_idx)
+                for orig_idx, entry in pending_with_indices
+            ]
             
-            entry_choice = questionary.select(
+            index = questionary.select(
                 "Which feedback to mark as done?",
                 choices=entry_choices,
                 use_arrow_keys=True
             ).ask()
             
-            if not entry_choice:
+            if index is None:
                 continue
             
-            # Extract original index
-            index = int(entry_choice.split(']')[0][1:])
-            
             # Select status (only implemented or dismissed, as those archive)
             status_choice = questionary.select(
                 "Mark as:",
@@ -363,24 +440,18 @@ def interactive_menu(storage: Storage, console: Console):
             
             if status_choice and status_choice != "Cancel":
                 if "Implemented" in status_choice:
-                    storage.update_feedback_status(index, 'implemented')
-                    storage.archive_feedback(index)
+                    storage.mark_and_archive(index, 'implemented')
                     console.print(f"[green]✓ Feedback #{index} marked as implemented and archived![/green]")
                 elif "Dismissed" in status_choice:
-                    storage.update_feedback_status(index, 'dismissed')
-                    storage.archive_feedback(index)
+                    storage.mark_and_archive(index, 'dismissed')
                     console.print(f"[yellow]✕ Feedback #{index} dismissed and archived.[/yellow]")
         
-        elif choice.startswith("["):
+        else:
             # User selected a specific feedback entry to view
-            try:
-                index = int(choice.split(']')[0][1:])
-                if 0 <= index < len(entries):
-                    show_feedback_detail(entries[index], index, console)
-                    console.print("\n[dim]Press Enter to continue...[/dim]")
-                    input()
-            except (ValueError, IndexError):
-                console.print("[red]Error displaying feedback[/red]")
+            show_feedback_detail(entries[choice], choice, console)
+            console.print("\n[dim]Press Enter to continue...[/dim]")
+            sys.stdout.flush()
+            sys.stdin.readline()
 
 
 def main():
@@ -117,3 +117,30 @@ def load_config(config_path: str = None) -> ConfigLoader:
         ConfigLoader instance
     """
     return ConfigLoader(config_path)
+
+
+# Last loader handed out by load_config_cached, with its config file's mtime
+_CONFIG_CACHE = {"loader": None, "mtime": None}
+
+
+def load_config_cached() -> ConfigLoader:
+    """Load the default configuration, re-parsing only when it changes.
+    
+    Meant for loops that redraw often, like the dashboard. The YAML file
+    is re-read only when its mtime differs from the last load.
+    
+    Returns:
+        ConfigLoader instance
+    """
+    loader = _CONFIG_CACHE["loader"]
+    if loader is None:
+        loader = load_config()
+        _CONFIG_CACHE["loader"] = loader
+        _CONFIG_CACHE["mtime"] = loader.config_path.stat().st_mtime_ns
+        return loader
+    
+    mtime = loader.config_path.stat().st_mtime_ns
+    if mtime != _CONFIG_CACHE["mtime"]:
+        loader._load_config()
+        _CONFIG_CACHE["mtime"] = mtime
+    return loader
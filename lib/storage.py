@@ -1,9 +1,42 @@
 """Data storage utilities for daily plans and logs."""
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+
+def json_dumps(data, indent: Optional[int] = None) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available.
+    
+    orjson only indents by 2 spaces and writes NaN and Infinity as null,
+    where the stdlib json module writes them as-is.
+    
+    Args:
+        data: JSON-serializable data
+        indent: Indentation, or None for compact output
+    
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def migrate_to_user_directory():
     """Migrate data from project directory to user directory on first run."""
@@ -29,6 +62,28 @@ def migrate_to_user_directory():
     print(f"✅ Migration complete!")
 
 
+@lru_cache(maxsize=4)
+def _list_plan_dates(data_dir: str, mtime_ns: int) -> tuple:
+    """List plan dates in a directory, cached until the directory changes.
+    
+    Args:
+        data_dir: Path to the data directory
+        mtime_ns: Directory modification time, used as the cache key
+    
+    Returns:
+        Tuple of date strings (YYYY-MM-DD format), sorted descending
+    """
+    with os.scandir(data_dir) as entries:
+        dates = [entry.name[:-10] for entry in entries if entry.name.endswith("-plan.json")]
+    dates.sort(reverse=True)
+    return tuple(dates)
+
+
+# Whether each plan counts toward the streak, keyed by plan path and
+# stored alongside the file's mtime
+_streak_days: Dict[str, tuple] = {}
+
+
 class Storage:
     """Handles saving and loading daily plans and logs."""
     
@@ -92,9 +147,7 @@ class Storage:
         Args:
             plan_data: Plan data dictionary
         """
-        json_path = self.get_plan_path()
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(plan_data, f, indent=2, ensure_ascii=False)
+        self.get_plan_path().write_bytes(json_dumps(plan_data, indent=2))
     
     def load_plan(self, date: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """Load daily plan.
@@ -105,12 +158,10 @@ class Storage:
         Returns:
             Plan data dictionary or None if not found
         """
-        json_path = self.get_plan_path(date)
-        if not json_path.exists():
+        try:
+            return json_loads(self.get_plan_path(date).read_bytes())
+        except FileNotFoundError:
             return None
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
     
     def save_log(self, log_data: Dict[str, Any], date: Optional[datetime] = None) -> None:
         """Save daily log.
@@ -367,11 +418,12 @@ class Storage:
         """
         return self.get_improves_path() / "archived_feedback.json"
     
-    def archive_feedback(self, index: int) -> bool:
+    def archive_feedback(self, index: int, status: Optional[str] = None) -> bool:
         """Archive a feedback entry (move to improves directory).
         
         Args:
             index: Index of feedback entry to archive
+            status: New status to record on the entry, if any
             
         Returns:
             True if successful
@@ -384,6 +436,8 @@ class Storage:
         
         # Get entry to archive
         entry = entries.pop(index)
+        if status is not None:
+            entry['status'] = status
         entry['archived_date'] = datetime.now().isoformat()
         
         # Load or create archived file
@@ -408,6 +462,18 @@ class Storage:
         
         return True
     
+    def mark_and_archive(self, index: int, status: str) -> bool:
+        """Set a feedback entry's final status and archive it in one pass.
+        
+        Args:
+            index: Index of feedback entry in tool_feedback.json
+            status: Final status ('implemented' or 'dismissed')
+            
+        Returns:
+            True if successful
+        """
+        return self.archive_feedback(index, status=status)
+    
     def load_archived_feedback(self) -> Dict[str, Any]:
         """Load all archived feedback entries.
         
@@ -490,19 +556,28 @@ class Storage:
         
         # Check each day going backwards
         while True:
-            plan = self.load_plan(current_date)
-            
-            if not plan:
+            json_path = self.get_plan_path(current_date)
+            try:
+                mtime = json_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 # No plan for this day, streak broken
                 break
             
-            completion = plan.get('completion_status', {})
-            
-            # Check if any task was completed (done or quit counts as resolved)
-            has_completed = any(
-                status == 'done' or status is True
-                for status in completion.values()
-            )
+            # Only re-read plans that changed since they were last checked
+            key = str(json_path)
+            cached = _streak_days.get(key)
+            if cached is not None and cached[0] == mtime:
+                has_completed = cached[1]
+            else:
+                plan = self.load_plan(current_date)
+                completion = plan.get('completion_status', {}) if plan else {}
+                
+                # Check if any task was completed (done or quit counts as resolved)
+                has_completed = bool(plan) and any(
+                    status == 'done' or status is True
+                    for status in completion.values()
+                )
+                _streak_days[key] = (mtime, has_completed)
             
             if has_completed:
                 streak += 1
@@ -519,13 +594,46 @@ class Storage:
         Returns:
             List of date strings (YYYY-MM-DD format), sorted descending
         """
-        plan_files = sorted(self.data_dir.glob("*-plan.json"), reverse=True)
-        dates = []
-        for f in plan_files:
-            date_str = f.stem.replace("-plan", "")
-            dates.append(date_str)
-        return dates
+        # Adding or removing a plan file bumps the directory's mtime
+        mtime_ns = self.data_dir.stat().st_mtime_ns
+        return list(_list_plan_dates(str(self.data_dir), mtime_ns))
 
+    def _scan_plan_files(self, start: datetime, end: datetime):
+        """Yield (date_str, DirEntry) for daily plan files between two dates.
+        
+        Scans the data directory once instead of probing one path per day.
+        
+        Args:
+            start: First date to include
+            end: Last date to include
+        """
+        start_str = self._get_date_str(start)
+        end_str = self._get_date_str(end)
+        
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith("-plan.json"):
+                    continue
+                date_str = name[:-10]
+                if len(date_str) == 10 and start_str <= date_str <= end_str:
+                    yield date_str, entry
+    
+    def get_plan_mtimes(self, start: datetime, end: datetime) -> Dict[str, int]:
+        """Get modification times of daily plans between two dates.
+        
+        Args:
+            start: First date to include
+            end: Last date to include
+        
+        Returns:
+            Dict of date string (YYYY-MM-DD) -> mtime in nanoseconds
+        """
+        return {
+            date_str: entry.stat().st_mtime_ns
+            for date_str, entry in self._scan_plan_files(start, end)
+        }
+    
     def get_upcoming_tasks(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get tasks from upcoming days.
 
@@ -535,11 +643,27 @@ class Storage:
         Returns:
             List of dicts with 'date', 'date_str', 'job_name', 'task_description', 'is_subtask'
         """
-        upcoming = []
-        today = datetime.now().date()
+        return [
+            task
+            for tasks in self.get_upcoming_tasks_grouped(days).values()
+            for task in tasks
+        ]
+
+    def get_upcoming_tasks_grouped(self, days: int = 7) -> Dict[str, List[Dict[str, Any]]]:
+        """Get tasks from upcoming days, grouped by date.
+
+        Args:
+            days: Number of days to look ahead (default: 7)
+
+        Returns:
+            Dict mapping 'YYYY-MM-DD' to that day's task dicts (as returned by
+            get_upcoming_tasks), in date order. Days without pending tasks are omitted.
+        """
+        grouped = {}
+        now = datetime.now()
 
         for day_offset in range(1, days + 1):
-            future_date = datetime.now() + timedelta(days=day_offset)
+            future_date = now + timedelta(days=day_offset)
             plan = self.load_plan(future_date)
 
             if not plan:
@@ -547,6 +671,7 @@ class Storage:
 
             completion = plan.get('completion_status', {})
             jobs = plan.get('jobs', [])
+            date_str = future_date.date().isoformat()
 
             # Extract incomplete tasks recursively
             def extract_tasks(job_list, parent_name=None):
@@ -559,7 +684,7 @@ class Storage:
                     if status != 'done' and status is not True and status != 'quit':
                         task_info = {
                             'date': future_date,
-                            'date_str': future_date.strftime("%Y-%m-%d"),
+                            'date_str': date_str,
                             'job_name': job_name,
                             'task_description': job.get('user_input', job.get('description', '')),
                             'is_subtask': parent_name is not None,
@@ -574,7 +699,9 @@ class Storage:
 
                 return tasks
 
-            upcoming.extend(extract_tasks(jobs))
+            tasks = extract_tasks(jobs)
+            if tasks:
+                grouped[date_str] = tasks
 
-        return upcoming
+        return grouped
 
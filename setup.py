@@ -24,6 +24,9 @@ setup(
         "questionary>=2.0.0",
         "flask>=3.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6.0"],
+    },
     python_requires=">=3.8",
     entry_points={
         'console_scripts': [
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Flask web server for Daily Planner & Logger."""
 import sys
+import copy
 import webbrowser
 import threading
 from pathlib import Path
@@ -201,7 +202,8 @@ from calendar_view import (
 @app.route('/api/goals')
 def api_get_goals():
     """Get all goals with hierarchy and calculated progress."""
-    goals_data = load_goals()
+    # load_goals shares its cached dict; the fields added below must not be saved
+    goals_data = copy.deepcopy(load_goals())
     
     def add_time_progress(goal_or_sub):
         """Add calculated time progress to goal/sub-goal."""